@@ -1,13 +1,12 @@
 import streamlit as st
-import pandas as pd
+import numpy as np
+import json
+import orjson
 import plotly.graph_objects as go
-import plotly.express as px
-from src.resume_parser import ResumeParser
-from src.nlp_processor import NLPProcessor
-from src.scorer import ResumeScorer
-import tempfile
-import os
 from datetime import datetime
+import csv
+import io
+import textwrap
 
 # Page configuration
 st.set_page_config(
@@ -46,18 +45,72 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+@st.cache_resource
+def _load_nlp():
+    """Load the spaCy model once per process and warm it up"""
+    from src.nlp_processor import load_spacy_model
+    
+    nlp = load_spacy_model()
+    if nlp is not None:
+        # Pay first-call initialization here rather than on the first upload
+        nlp("warmup")
+    return nlp
+
 @st.cache_resource
 def load_processors():
     """Load and cache the processing components"""
     try:
+        # Imported here so the heavy NLP/PDF dependencies load with the cached processors
+        from src.resume_parser import ResumeParser
+        from src.nlp_processor import NLPProcessor
+        from src.scorer import ResumeScorer
+        
         parser = ResumeParser()
-        nlp_processor = NLPProcessor()
+        nlp_processor = NLPProcessor(_load_nlp())
         scorer = ResumeScorer()
         return parser, nlp_processor, scorer
     except Exception as e:
         st.error(f"Error loading processors: {str(e)}")
         return None, None, None
 
+@st.cache_data(show_spinner=False, max_entries=32)
+def _parse_and_nlp(file_bytes, filename):
+    """Parse and run NLP on an uploaded resume, cached by file content"""
+    parser, nlp_processor, _ = load_processors()
+    resume_text = parser.parse_bytes(file_bytes, filename)
+    
+    if not resume_text or len(resume_text.strip()) < 50:
+        return resume_text, None
+    
+    return resume_text, nlp_processor.process_resume(resume_text)
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _parse_and_nlp_batch(files):
+    """Parse a batch of resumes and run NLP over them in one spaCy pass"""
+    parser, nlp_processor, _ = load_processors()
+    # Parsed one after another: PyMuPDF does not support use from several threads
+    resume_texts = [parser.parse_bytes(file_bytes, filename) for filename, file_bytes in files]
+    
+    # Unreadable files stay as None so they can be reported instead of scored
+    readable = [text for text in resume_texts if text and len(text.strip()) >= 50]
+    processed = iter(nlp_processor.process_resumes(readable))
+    return [
+        (text, next(processed) if text and len(text.strip()) >= 50 else None)
+        for text in resume_texts
+    ]
+
+# Display names for score components on the breakdown chart
+COMPONENT_CHART_LABELS = {
+    'skills_match': 'Skills Match',
+    'experience_years': 'Experience',
+    'education': 'Education',
+    'resume_quality': 'Resume Quality'
+}
+
+# Figures are cached as shared objects rather than pickled copies: unpickling a
+# plotly Figure rebuilds and revalidates it, which is the cost being avoided.
+# st.plotly_chart only reads the figure, so callers must not mutate it.
+@st.cache_resource(show_spinner=False, max_entries=64)
 def create_gauge_chart(score_percentage, title="Overall Score"):
     """Create a gauge chart for score visualization"""
     fig = go.Figure(go.Indicator(
@@ -94,29 +147,24 @@ def create_gauge_chart(score_percentage, title="Overall Score"):
     
     return fig
 
+@st.cache_resource(show_spinner=False, max_entries=64)
 def create_component_bar_chart(component_scores):
     """Create bar chart for component scores"""
-    components = list(component_scores.keys())
-    scores = [score * 100 for score in component_scores.values()]
+    components = tuple(component_scores)
+    scores = np.fromiter(component_scores.values(), dtype=np.float64, count=len(components)) * 100.0
     
     # Clean up component names
-    clean_components = []
-    for comp in components:
-        clean_name = comp.replace('_', ' ').title()
-        if clean_name == 'Skills Match':
-            clean_name = 'Skills Match'
-        elif clean_name == 'Experience Years':
-            clean_name = 'Experience'
-        elif clean_name == 'Resume Quality':
-            clean_name = 'Resume Quality'
-        clean_components.append(clean_name)
+    clean_components = [
+        COMPONENT_CHART_LABELS.get(comp) or comp.replace('_', ' ').title()
+        for comp in components
+    ]
     
     fig = go.Figure(data=[
         go.Bar(
             x=clean_components,
             y=scores,
             marker_color=['#ff7f0e', '#2ca02c', '#d62728', '#9467bd'],
-            text=[f'{score:.1f}%' for score in scores],
+            text=[f'{score:.1f}%' for score in scores.tolist()],
             textposition='auto',
         )
     ])
@@ -141,12 +189,80 @@ def display_skills(skills_dict):
     for category, skills in skills_dict.items():
         if skills:
             st.write(f"**{category.title().replace('_', ' ')}:**")
-            skills_html = ""
-            for skill in skills:
-                skills_html += f'<span class="skill-tag">{skill}</span>'
+            skills_html = "".join(f'<span class="skill-tag">{skill}</span>' for skill in skills)
             st.markdown(skills_html, unsafe_allow_html=True)
             st.write("")  # Add spacing
 
+def _freeze(value):
+    """Convert nested dicts/lists into hashable tuples for use in cache keys"""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+def build_results_row(file_name, processed_data, scoring_result):
+    """Flatten one candidate's results into a row for tables and CSV export"""
+    return {
+        'File_Name': file_name,
+        'Overall_Score': scoring_result['score_percentage'],
+        'Skills_Score': scoring_result['component_scores']['skills_match'] * 100,
+        'Experience_Score': scoring_result['component_scores']['experience_years'] * 100,
+        'Education_Score': scoring_result['component_scores']['education'] * 100,
+        'Quality_Score': scoring_result['component_scores']['resume_quality'] * 100,
+        'Total_Experience': processed_data['experience']['total_years'],
+        'Education_Level': processed_data['education']['level'],
+        'Email': processed_data['contact_info']['email'],
+        'Phone': processed_data['contact_info']['phone'],
+        'Recommendation': scoring_result.get('recommendation', ''),
+        'Processing_Date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    }
+
+def _batch_scoring_result(record):
+    """Shape one row of a batch score array like a calculate_overall_score result"""
+    return {
+        'score_percentage': float(record['score_percentage']),
+        'component_scores': {
+            component: float(record[component])
+            for component in ('skills_match', 'experience_years', 'education', 'resume_quality')
+        },
+        'recommendation': record['recommendation']
+    }
+
+def build_results_csv(rows):
+    """Format results rows as CSV text with a header line"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(rows[0].keys())
+    writer.writerows(row.values() for row in rows)
+    return buffer.getvalue()
+
+# Memoized on the raw widget values so unchanged inputs skip re-parsing. Streamlit
+# executes the script in a fresh module on every rerun, which would start an
+# lru_cache empty each time; st.cache_resource keeps one cache for the process.
+# The returned dict is shared between reruns and must be treated as read-only
+@st.cache_resource(show_spinner=False, max_entries=64)
+def _normalize_requirements(required_skills_input, nice_to_have_input, min_experience,
+                            preferred_experience, required_education, preferred_education,
+                            job_title, company_name):
+    """Build the job requirements dict from raw sidebar input values"""
+    # Process inputs
+    required_skills = [skill.strip() for skill in required_skills_input.split(',') if skill.strip()]
+    nice_to_have_skills = [skill.strip() for skill in nice_to_have_input.split(',') if skill.strip()]
+    
+    job_requirements = {
+        'required_skills': required_skills,
+        'nice_to_have_skills': nice_to_have_skills,
+        'min_experience': min_experience,
+        'preferred_experience': preferred_experience if preferred_experience > min_experience else None,
+        'education_level': required_education if required_education != "None" else None,
+        'preferred_education_level': preferred_education if preferred_education != "None" and preferred_education != required_education else None,
+        'job_title': job_title,
+        'company_name': company_name
+    }
+    
+    return job_requirements
+
 def process_job_requirements():
     """Process job requirements from sidebar inputs"""
     st.sidebar.header("📋 Job Requirements")
@@ -213,22 +329,259 @@ def process_job_requirements():
     job_title = st.sidebar.text_input("Job Title", placeholder="e.g., Senior Software Engineer")
     company_name = st.sidebar.text_input("Company Name", placeholder="e.g., Tech Corp Inc.")
     
-    # Process inputs
-    required_skills = [skill.strip() for skill in required_skills_input.split(',') if skill.strip()]
-    nice_to_have_skills = [skill.strip() for skill in nice_to_have_input.split(',') if skill.strip()]
+    return _normalize_requirements(
+        required_skills_input, nice_to_have_input, min_experience, preferred_experience,
+        required_education, preferred_education, job_title, company_name
+    )
+
+# Rendered as a fragment so interactions inside the results panel rerun only this section
+@st.fragment
+def _render_results(resume_text, processed_data, scoring_result, file_name, job_requirements):
+    """Render the analysis results, score breakdown and export buttons"""
+    st.header("📊 Analysis Results")
     
-    job_requirements = {
-        'required_skills': required_skills,
-        'nice_to_have_skills': nice_to_have_skills,
-        'min_experience': min_experience,
-        'preferred_experience': preferred_experience if preferred_experience > min_experience else None,
-        'education_level': required_education if required_education != "None" else None,
-        'preferred_education_level': preferred_education if preferred_education != "None" and preferred_education != required_education else None,
-        'job_title': job_title,
-        'company_name': company_name
+    # Overall Score Section
+    col1, col2, col3 = st.columns([2, 1, 1])
+    
+    with col1:
+        # Gauge chart
+        gauge_fig = create_gauge_chart(scoring_result['score_percentage'])
+        st.plotly_chart(gauge_fig, use_container_width=True)
+    
+    with col2:
+        st.metric(
+            label="Overall Score",
+            value=f"{scoring_result['score_percentage']}%",
+            delta=f"{scoring_result['score_percentage'] - 70:.1f}% from benchmark"
+        )
+        
+        # Recommendation
+        recommendation = scoring_result.get('recommendation', 'No recommendation')
+        if 'Strong' in recommendation:
+            st.success(recommendation)
+        elif 'Good' in recommendation:
+            st.info(recommendation)
+        elif 'Moderate' in recommendation:
+            st.warning(recommendation)
+        else:
+            st.error(recommendation)
+    
+    with col3:
+        # Quick stats
+        st.metric("Experience", f"{processed_data['experience']['total_years']} years")
+        st.metric("Education", processed_data['education']['level'] or 'Not specified')
+        st.metric("Skills Found", processed_data['total_skills'])
+    
+    # Component Scores
+    st.subheader("📈 Detailed Score Breakdown")
+    
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        # Bar chart
+        bar_fig = create_component_bar_chart(scoring_result['component_scores'])
+        st.plotly_chart(bar_fig, use_container_width=True)
+    
+    with col2:
+        # Component scores as metrics
+        st.write("**Individual Component Scores:**")
+        for component, score in scoring_result['component_scores'].items():
+            clean_name = component.replace('_', ' ').title()
+            st.metric(
+                label=clean_name,
+                value=f"{score:.2f}",
+                delta=f"{score - 0.7:.2f}" if score != 0 else None
+            )
+    
+    # Detailed Information Sections
+    st.header("📋 Extracted Information")
+    
+    # Only the selected section is rendered on each rerun
+    section = st.radio(
+        "Section",
+        ["👤 Contact", "💼 Experience", "🎓 Education", "🛠️ Skills"],
+        horizontal=True,
+        label_visibility="collapsed",
+        key="tab_choice"
+    )
+    
+    if section == "👤 Contact":
+        st.subheader("Contact Information")
+        contact = processed_data['contact_info']
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            if contact['email']:
+                st.success(f"📧 **Email:** {contact['email']}")
+            else:
+                st.warning("📧 **Email:** Not found")
+        
+        with col2:
+            if contact['phone']:
+                st.success(f"📞 **Phone:** {contact['phone']}")
+            else:
+                st.warning("📞 **Phone:** Not found")
+        
+        with col3:
+            if contact['linkedin']:
+                st.success(f"💼 **LinkedIn:** {contact['linkedin']}")
+            else:
+                st.warning("💼 **LinkedIn:** Not found")
+    
+    elif section == "💼 Experience":
+        st.subheader("Professional Experience")
+        experience = processed_data['experience']
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Total Experience", f"{experience['total_years']} years")
+            
+            if experience.get('organizations'):
+                st.write("**Organizations:**")
+                for org in experience['organizations'][:5]:  # Show top 5
+                    st.write(f"• {org}")
+        
+        with col2:
+            if experience.get('job_titles'):
+                st.write("**Job Titles Found:**")
+                for title in experience['job_titles'][:5]:  # Show top 5
+                    st.write(f"• {title}")
+    
+    elif section == "🎓 Education":
+        st.subheader("Educational Background")
+        education = processed_data['education']
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            if education['has_degree']:
+                st.success(f"🎓 **Degree Level:** {education['level'] or 'Detected but unspecified'}")
+            else:
+                st.warning("🎓 **Degree:** Not clearly identified")
+        
+        with col2:
+            if education.get('institutions'):
+                st.write("**Institutions:**")
+                for institution in education['institutions'][:3]:
+                    st.write(f"• {institution}")
+    
+    elif section == "🛠️ Skills":
+        st.subheader("Technical & Professional Skills")
+        display_skills(processed_data['skills'])
+    
+    # Feedback Section
+    if 'feedback' in scoring_result:
+        st.header("💡 AI Feedback & Recommendations")
+        
+        feedback = scoring_result['feedback']
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            if 'skills' in feedback:
+                st.info(f"**Skills:** {feedback['skills']}")
+            
+            if 'experience' in feedback:
+                st.info(f"**Experience:** {feedback['experience']}")
+        
+        with col2:
+            if 'education' in feedback:
+                st.info(f"**Education:** {feedback['education']}")
+            
+            if 'quality' in feedback:
+                st.info(f"**Resume Quality:** {feedback['quality']}")
+    
+    # Raw resume text, only sent to the browser once the toggle is switched on
+    if st.toggle("📄 View Raw Resume Text", key="show_raw"):
+        with st.container(height=300):
+            # Cleaned text is a single line, so wrap it for the read-only code block
+            st.code(textwrap.fill(resume_text, width=100), language=None)
+    
+    # Download results
+    st.header("📥 Export Results")
+    
+    # Create summary data for download
+    summary_data = {
+        'Candidate_Info': {
+            'File_Name': file_name,
+            'Processing_Date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'Overall_Score': scoring_result['score_percentage'],
+            'Recommendation': scoring_result.get('recommendation', ''),
+        },
+        'Contact_Info': processed_data['contact_info'],
+        'Skills': processed_data['skills'],
+        'Experience': processed_data['experience'],
+        'Education': processed_data['education'],
+        'Component_Scores': scoring_result['component_scores'],
+        'Job_Requirements': job_requirements
     }
     
-    return job_requirements
+    # Flat results row for CSV download
+    results_row = build_results_row(file_name, processed_data, scoring_result)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        csv_data = build_results_csv([results_row])
+        st.download_button(
+            label="📊 Download Results as CSV",
+            data=csv_data,
+            file_name=f"resume_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            mime="text/csv"
+        )
+    
+    with col2:
+        try:
+            json_data = orjson.dumps(
+                summary_data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                default=str
+            )
+        except orjson.JSONEncodeError:
+            # orjson rejects ints outside the 64-bit range without calling default
+            json_data = json.dumps(summary_data, indent=2, default=str)
+        st.download_button(
+            label="📋 Download Detailed JSON",
+            data=json_data,
+            file_name=f"detailed_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+            mime="application/json"
+        )
+
+def _render_batch_results(file_names, batch_results, scoring_results):
+    """Render a ranked comparison table for a batch of resumes"""
+    st.header("📊 Batch Screening Results")
+    
+    rows = []
+    unreadable = []
+    for file_name, (resume_text, processed_data), scoring_result in zip(file_names, batch_results, scoring_results):
+        if processed_data is None:
+            unreadable.append(file_name)
+        else:
+            rows.append(build_results_row(file_name, processed_data, _batch_scoring_result(scoring_result)))
+    
+    if unreadable:
+        st.warning(f"Could not extract sufficient text from: {', '.join(unreadable)}")
+    
+    if not rows:
+        return
+    
+    # Rank candidates by overall score
+    rows.sort(key=lambda row: row['Overall_Score'], reverse=True)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Resumes Screened", len(rows))
+    with col2:
+        st.metric("Top Score", f"{rows[0]['Overall_Score']}%")
+    with col3:
+        st.metric("Average Score", f"{sum(row['Overall_Score'] for row in rows) / len(rows):.1f}%")
+    
+    st.dataframe(rows, use_container_width=True, hide_index=True)
+    
+    st.download_button(
+        label="📊 Download Ranking as CSV",
+        data=build_results_csv(rows),
+        file_name=f"resume_ranking_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+        mime="text/csv"
+    )
 
 def main():
     # Header
@@ -250,12 +603,16 @@ def main():
     with col1:
         st.header("📁 Upload Resume")
         
-        uploaded_file = st.file_uploader(
-            "Choose a resume file",
+        uploaded_files = st.file_uploader(
+            "Choose resume files",
             type=['pdf', 'docx'],
-            help="Supported formats: PDF, DOCX (Max size: 200MB)"
+            accept_multiple_files=True,
+            help="Supported formats: PDF, DOCX (Max size: 200MB). Upload several files to rank candidates."
         )
         
+        # A single upload gets the detailed analysis, several get a ranked batch
+        uploaded_file = uploaded_files[0] if len(uploaded_files) == 1 else None
+        
         # Display job requirements summary
         if any(job_requirements.values()):
             st.subheader("📋 Current Job Requirements")
@@ -277,11 +634,11 @@ def main():
                 st.write(f"**Education:** {job_requirements['education_level']} degree")
     
     with col2:
-        if uploaded_file is None:
+        if not uploaded_files:
             st.header("👋 Getting Started")
             st.info("""
             1. **Set Job Requirements** in the sidebar
-            2. **Upload a resume** using the file uploader
+            2. **Upload a resume** using the file uploader (or several to rank candidates)
             3. **Get instant AI analysis** and scoring
             4. **Review detailed breakdown** and recommendations
             """)
@@ -298,225 +655,33 @@ Education: Bachelors degree
     # Process uploaded file
     if uploaded_file is not None:
         try:
-            with st.spinner("🔄 Processing resume... This may take a few moments."):
-                # Parse resume
-                resume_text = parser.parse_resume(uploaded_file)
-                
-                if not resume_text or len(resume_text.strip()) < 50:
-                    st.error("Could not extract sufficient text from the resume. Please ensure the file is readable and contains text.")
-                    st.stop()
-                
-                # Process with NLP
-                processed_data = nlp_processor.process_resume(resume_text)
-                
-                # Calculate score
-                scoring_result = scorer.calculate_overall_score(processed_data, job_requirements)
-            
-            # Display Results
-            st.header("📊 Analysis Results")
-            
-            # Overall Score Section
-            col1, col2, col3 = st.columns([2, 1, 1])
-            
-            with col1:
-                # Gauge chart
-                gauge_fig = create_gauge_chart(scoring_result['score_percentage'])
-                st.plotly_chart(gauge_fig, use_container_width=True)
-            
-            with col2:
-                st.metric(
-                    label="Overall Score",
-                    value=f"{scoring_result['score_percentage']}%",
-                    delta=f"{scoring_result['score_percentage'] - 70:.1f}% from benchmark"
-                )
-                
-                # Recommendation
-                recommendation = scoring_result.get('recommendation', 'No recommendation')
-                if 'Strong' in recommendation:
-                    st.success(recommendation)
-                elif 'Good' in recommendation:
-                    st.info(recommendation)
-                elif 'Moderate' in recommendation:
-                    st.warning(recommendation)
-                else:
-                    st.error(recommendation)
-            
-            with col3:
-                # Quick stats
-                st.metric("Experience", f"{processed_data['experience']['total_years']} years")
-                st.metric("Education", processed_data['education']['level'] or 'Not specified')
-                total_skills = sum(len(skills) for skills in processed_data['skills'].values())
-                st.metric("Skills Found", total_skills)
-            
-            # Component Scores
-            st.subheader("📈 Detailed Score Breakdown")
-            
-            col1, col2 = st.columns([1, 1])
-            
-            with col1:
-                # Bar chart
-                bar_fig = create_component_bar_chart(scoring_result['component_scores'])
-                st.plotly_chart(bar_fig, use_container_width=True)
-            
-            with col2:
-                # Component scores as metrics
-                st.write("**Individual Component Scores:**")
-                for component, score in scoring_result['component_scores'].items():
-                    clean_name = component.replace('_', ' ').title()
-                    st.metric(
-                        label=clean_name,
-                        value=f"{score:.2f}",
-                        delta=f"{score - 0.7:.2f}" if score != 0 else None
-                    )
-            
-            # Detailed Information Sections
-            st.header("📋 Extracted Information")
-            
-            tab1, tab2, tab3, tab4 = st.tabs(["👤 Contact", "💼 Experience", "🎓 Education", "🛠️ Skills"])
-            
-            with tab1:
-                st.subheader("Contact Information")
-                contact = processed_data['contact_info']
-                
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    if contact['email']:
-                        st.success(f"📧 **Email:** {contact['email']}")
-                    else:
-                        st.warning("📧 **Email:** Not found")
-                
-                with col2:
-                    if contact['phone']:
-                        st.success(f"📞 **Phone:** {contact['phone']}")
-                    else:
-                        st.warning("📞 **Phone:** Not found")
-                
-                with col3:
-                    if contact['linkedin']:
-                        st.success(f"💼 **LinkedIn:** {contact['linkedin']}")
-                    else:
-                        st.warning("💼 **LinkedIn:** Not found")
-            
-            with tab2:
-                st.subheader("Professional Experience")
-                experience = processed_data['experience']
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.metric("Total Experience", f"{experience['total_years']} years")
-                    
-                    if experience.get('organizations'):
-                        st.write("**Organizations:**")
-                        for org in experience['organizations'][:5]:  # Show top 5
-                            st.write(f"• {org}")
-                
-                with col2:
-                    if experience.get('job_titles'):
-                        st.write("**Job Titles Found:**")
-                        for title in experience['job_titles'][:5]:  # Show top 5
-                            st.write(f"• {title}")
-            
-            with tab3:
-                st.subheader("Educational Background")
-                education = processed_data['education']
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    if education['has_degree']:
-                        st.success(f"🎓 **Degree Level:** {education['level'] or 'Detected but unspecified'}")
-                    else:
-                        st.warning("🎓 **Degree:** Not clearly identified")
-                
-                with col2:
-                    if education.get('institutions'):
-                        st.write("**Institutions:**")
-                        for institution in education['institutions'][:3]:
-                            st.write(f"• {institution}")
-            
-            with tab4:
-                st.subheader("Technical & Professional Skills")
-                display_skills(processed_data['skills'])
+            # file_id is stable for an upload, so reruns with the same file skip
+            # reading and hashing its bytes for the parse cache lookup
+            file_id = uploaded_file.file_id
+            if st.session_state.get('last_fid') == file_id:
+                resume_text, processed_data = st.session_state['last_processed']
+            else:
+                with st.spinner("🔄 Processing resume... This may take a few moments."):
+                    # Parse and process with NLP (cached per file content)
+                    resume_text, processed_data = _parse_and_nlp(uploaded_file.getvalue(), uploaded_file.name)
+                st.session_state.update(last_fid=file_id, last_processed=(resume_text, processed_data))
             
-            # Feedback Section
-            if 'feedback' in scoring_result:
-                st.header("💡 AI Feedback & Recommendations")
-                
-                feedback = scoring_result['feedback']
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    if 'skills' in feedback:
-                        st.info(f"**Skills:** {feedback['skills']}")
-                    
-                    if 'experience' in feedback:
-                        st.info(f"**Experience:** {feedback['experience']}")
-                
-                with col2:
-                    if 'education' in feedback:
-                        st.info(f"**Education:** {feedback['education']}")
-                    
-                    if 'quality' in feedback:
-                        st.info(f"**Resume Quality:** {feedback['quality']}")
+            if processed_data is None:
+                st.error("Could not extract sufficient text from the resume. Please ensure the file is readable and contains text.")
+                st.stop()
             
-            # Raw resume text (expandable)
-            with st.expander("📄 View Raw Resume Text"):
-                st.text_area("Resume Content", resume_text, height=300)
-            
-            # Download results
-            st.header("📥 Export Results")
-            
-            # Create summary data for download
-            summary_data = {
-                'Candidate_Info': {
-                    'File_Name': uploaded_file.name,
-                    'Processing_Date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    'Overall_Score': scoring_result['score_percentage'],
-                    'Recommendation': scoring_result.get('recommendation', ''),
-                },
-                'Contact_Info': processed_data['contact_info'],
-                'Skills': processed_data['skills'],
-                'Experience': processed_data['experience'],
-                'Education': processed_data['education'],
-                'Component_Scores': scoring_result['component_scores'],
-                'Job_Requirements': job_requirements
-            }
-            
-            # Convert to DataFrame for download
-            results_df = pd.DataFrame([{
-                'File_Name': uploaded_file.name,
-                'Overall_Score': scoring_result['score_percentage'],
-                'Skills_Score': scoring_result['component_scores']['skills_match'] * 100,
-                'Experience_Score': scoring_result['component_scores']['experience_years'] * 100,
-                'Education_Score': scoring_result['component_scores']['education'] * 100,
-                'Quality_Score': scoring_result['component_scores']['resume_quality'] * 100,
-                'Total_Experience': processed_data['experience']['total_years'],
-                'Education_Level': processed_data['education']['level'],
-                'Email': processed_data['contact_info']['email'],
-                'Phone': processed_data['contact_info']['phone'],
-                'Recommendation': scoring_result.get('recommendation', ''),
-                'Processing_Date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }])
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                csv = results_df.to_csv(index=False)
-                st.download_button(
-                    label="📊 Download Results as CSV",
-                    data=csv,
-                    file_name=f"resume_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv"
-                )
+            # Reuse the last score when neither the file nor the requirements changed
+            score_key = (file_id, _freeze(job_requirements))
+            cached = st.session_state.get('score_cache')
+            if cached is not None and cached[0] == score_key:
+                scoring_result = cached[1]
+            else:
+                # Calculate score (kept outside the cache so requirement edits rescore instantly)
+                scoring_result = scorer.calculate_overall_score(processed_data, job_requirements)
+                st.session_state['score_cache'] = (score_key, scoring_result)
             
-            with col2:
-                import json
-                json_data = json.dumps(summary_data, indent=2, default=str)
-                st.download_button(
-                    label="📋 Download Detailed JSON",
-                    data=json_data,
-                    file_name=f"detailed_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                    mime="application/json"
-                )
+            # Display Results
+            _render_results(resume_text, processed_data, scoring_result.to_dict(), uploaded_file.name, job_requirements)
             
         except Exception as e:
             st.error(f"❌ Error processing resume: {str(e)}")
@@ -525,6 +690,27 @@ Education: Bachelors degree
             st.write("2. Check that the file contains readable text")
             st.write("3. Try a different file format")
             st.write("4. Make sure the file is not corrupted")
+    
+    # Process a batch of uploaded files
+    elif len(uploaded_files) > 1:
+        try:
+            files = tuple((uploaded.name, uploaded.getvalue()) for uploaded in uploaded_files)
+            
+            with st.spinner(f"🔄 Processing {len(files)} resumes... This may take a few moments."):
+                batch_results = _parse_and_nlp_batch(files)
+                # Unreadable files score as empty results and are listed separately
+                scoring_results = scorer.calculate_overall_scores_batch(
+                    [processed_data for _, processed_data in batch_results], job_requirements
+                )
+            
+            _render_batch_results([filename for filename, _ in files], batch_results, scoring_results)
+            
+        except Exception as e:
+            st.error(f"❌ Error processing resumes: {str(e)}")
+            st.write("**Troubleshooting tips:**")
+            st.write("1. Ensure each file is a valid PDF or DOCX")
+            st.write("2. Check that the files contain readable text")
+            st.write("3. Try uploading the files one at a time to find a problem file")
 
 # Sidebar information
 def sidebar_info():
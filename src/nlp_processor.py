@@ -1,146 +1,220 @@
 import spacy
 import re
+import os
+import functools
+import multiprocessing
+import hashlib
 from datetime import datetime
 from collections import Counter
 import string
+import numpy as np
+from .skills import TECH_SKILLS, LEVEL_ID, normalize_skill, skill_bits
+from .scorer_kernels import max_year_span
+from .scorer import quality_features
+from .cache import LRUCache
+
+# Number of texts spaCy processes per batch in nlp.pipe (tunable per deployment)
+SPACY_BATCH_SIZE = int(os.environ.get("RESUME_SPACY_BATCH_SIZE", "32"))
+
+# Worker processes for nlp.pipe on large batches (-1 uses every CPU core)
+SPACY_N_PROCESS = int(os.environ.get("RESUME_SPACY_N_PROCESS", "1"))
+
+def _workers_are_forked():
+    """Whether multiprocessing starts workers by forking this process"""
+    # The first listed start method is the platform default
+    method = multiprocessing.get_start_method(allow_none=True) or multiprocessing.get_all_start_methods()[0]
+    return method == 'fork'
+
+# Processed results kept per NLPProcessor, keyed by a hash of the resume text
+RESULT_CACHE_SIZE = 256
+
+def _trie_pattern(words):
+    """Build a regex alternation factored into a character trie, e.g. ja(?:va(?:script)?)"""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        if len(branches) == 1 and '' not in node:
+            return branches[0]
+        group = '(?:' + '|'.join(branches) + ')'
+        # Optional groups are greedy, so the longest skill at a position is tried first
+        return group + '?' if '' in node else group
+    
+    return build(trie)
+
+# Every skill in one word-bounded pattern, so one scan of the lowercased text finds
+# all of them. Word boundaries rather than spaCy tokens keep forms like react.js
+# matching. The trie shape lets the regex engine follow one branch per character
+# instead of trying each skill in turn at every position of the text
+SKILL_RE = re.compile(
+    r'\b(' + _trie_pattern({skill for skills in TECH_SKILLS.values() for skill in skills}) + r')\b'
+)
+
+# Regex patterns are compiled once at import instead of on every call
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+# Phone formats, tried in order; the first pattern that matches wins
+PHONE_RES = [
+    # International with country code
+    re.compile(r'\+\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9}'),
+    # US format with parentheses: (123) 456-7890
+    re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'),
+    # US format with dots: 123.456.7890
+    re.compile(r'\d{3}\.\d{3}\.\d{4}'),
+    # US format with dashes: 123-456-7890
+    re.compile(r'\d{3}-\d{3}-\d{4}'),
+    # Simple 10 digit: 1234567890
+    re.compile(r'\b\d{10}\b'),
+    # Indian format: +91 12345 67890 or +91-1234567890
+    re.compile(r'\+91[-.\s]?\d{5}[-.\s]?\d{5}'),
+    re.compile(r'\+91[-.\s]?\d{10}'),
+    # General international
+    re.compile(r'\b\d{3}[-.\s]\d{3}[-.\s]\d{4}\b'),
+]
+
+# LinkedIn: full URL, then URL without protocol. Matched case-sensitively
+# against lowercased text, which is faster than an IGNORECASE scan
+LINKEDIN_URL_RE = re.compile(r'https?://(?:www\.)?linkedin\.com/(?:in|pub)/[\w\-]+')
+LINKEDIN_PARTIAL_RE = re.compile(r'(?:www\.)?linkedin\.com/(?:in|pub)/[\w\-]+')
+
+# Years of experience, matched against lowercased text
+YEARS_RES = [
+    re.compile(r'(\d+)[\s\-]*(?:years?|yrs?)[\s\-]*(?:of\s+)?(?:experience|exp)'),
+    re.compile(r'(?:experience|exp)[\s\-]*(?:of\s+)?(\d+)[\s\-]*(?:years?|yrs?)'),
+    re.compile(r'(\d+)\+?\s*(?:years?|yrs?)'),
+]
+YEARS_FALLBACK_RE = re.compile(r'(\d+)[\s-]*(?:years?|yrs?)')
+
+# Cap on stated years of experience. Longer digit runs are noise, and the
+# scorer and exports need a value that fits a float64 and a 64-bit int
+MAX_TOTAL_YEARS = 100
+
+# Date ranges like "2020-2023", "2020-present", "Jan 2020 - Dec 2022"
+DATE_RANGE_RES = [
+    re.compile(r'(\d{4})\s*[-–]\s*(\d{4})'),
+    re.compile(r'(\d{4})\s*[-–]\s*(?:present|current)'),
+    re.compile(r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s+(\d{4})\s*[-–]\s*(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s+(\d{4})'),
+]
+
+# Education keywords and the degree level ladder (highest first), matched as
+# substrings of the lowercased text; plain `in` checks stop at the first hit
+# and beat a combined regex, which has to visit every position of the text
+EDUCATION_KEYWORDS = (
+    'bachelor', 'master', 'phd', 'doctorate', 'degree', 'diploma',
+    'university', 'college', 'institute', 'school'
+)
+DEGREE_LEVELS = (
+    ('PhD', ('phd', 'ph.d', 'doctorate')),
+    ('Masters', ('master', 'mba', 'm.s', 'm.a')),
+    ('Bachelors', ('bachelor', 'b.s', 'b.a', 'b.tech')),
+    ('Associates', ('associate',)),
+)
+
+# ORG entities that look like schools: dropped from employers, kept as institutions
+NON_EMPLOYER_ORG_RE = re.compile(r'university|college|school|degree', re.IGNORECASE)
+INSTITUTION_ORG_RE = re.compile(r'university|college|institute|school', re.IGNORECASE)
+
+@functools.lru_cache(maxsize=1)
+def load_spacy_model():
+    """Load the English spaCy model once per process, or return None if it is not installed"""
+    try:
+        # Only NER (doc.ents) is used. Excluded components are never loaded from
+        # disk; the ner component has its own internal tok2vec, so the shared
+        # tok2vec (which only fed the tagger and parser) can go as well
+        return spacy.load(
+            "en_core_web_sm",
+            exclude=["tok2vec", "tagger", "parser", "senter", "attribute_ruler", "lemmatizer"]
+        )
+    except OSError:
+        print("spaCy English model not found. Please run: python -m spacy download en_core_web_sm")
+        return None
 
 class NLPProcessor:
     """Class to handle NLP processing and information extraction from resumes"""
     
-    def __init__(self):
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            print("spaCy English model not found. Please run: python -m spacy download en_core_web_sm")
-            self.nlp = None
+    def __init__(self, nlp=None):
+        # Accept a preloaded model so callers can share one across instances
+        self.nlp = nlp if nlp is not None else load_spacy_model()
         
         # Predefined skill sets (expand these based on your needs)
-        self.tech_skills = {
-            'programming': [
-                'python', 'java', 'javascript', 'c++', 'c#', 'php', 'ruby', 'go',
-                'swift', 'kotlin', 'scala', 'r', 'matlab', 'sql', 'html', 'css',
-                'typescript', 'perl', 'shell', 'bash', 'powershell'
-            ],
-            'frameworks': [
-                'react', 'angular', 'vue', 'django', 'flask', 'spring', 'nodejs',
-                'express', 'laravel', 'rails', 'tensorflow', 'pytorch', 'keras',
-                'scikit-learn', 'pandas', 'numpy', 'bootstrap', 'jquery'
-            ],
-            'tools': [
-                'git', 'docker', 'kubernetes', 'jenkins', 'ansible', 'terraform',
-                'vagrant', 'maven', 'gradle', 'npm', 'yarn', 'webpack', 'jira',
-                'confluence', 'slack', 'trello'
-            ],
-            'databases': [
-                'mysql', 'postgresql', 'mongodb', 'oracle', 'redis', 'elasticsearch',
-                'sqlite', 'cassandra', 'dynamodb', 'neo4j', 'influxdb'
-            ],
-            'cloud': [
-                'aws', 'azure', 'gcp', 'heroku', 'digital ocean', 'linode',
-                's3', 'ec2', 'lambda', 'cloudformation', 'terraform'
-            ],
-            'soft_skills': [
-                'leadership', 'communication', 'teamwork', 'problem solving',
-                'project management', 'agile', 'scrum', 'kanban', 'analytical',
-                'creative', 'innovative', 'collaborative'
-            ]
-        }
+        self.tech_skills = TECH_SKILLS
         
-    def extract_contact_info(self, text):
+        # LRU of processed results; cached dicts are shared and must be treated as read-only
+        self._result_cache = LRUCache(RESULT_CACHE_SIZE)
+    
+    def extract_contact_info(self, text, text_lower=None):
         """Extract email, phone, LinkedIn from resume text"""
-        contact = {}
+        contact = {'email': None, 'phone': None, 'linkedin': None}
         
         # Email extraction
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        contact['email'] = emails[0] if emails else None
-        
-        # Phone extraction (various formats) - IMPROVED
-        phone_patterns = [
-            # International with country code
-            r'\+\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9}',
-            # US format with parentheses: (123) 456-7890
-            r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-            # US format with dots: 123.456.7890
-            r'\d{3}\.\d{3}\.\d{4}',
-            # US format with dashes: 123-456-7890
-            r'\d{3}-\d{3}-\d{4}',
-            # Simple 10 digit: 1234567890
-            r'\b\d{10}\b',
-            # Indian format: +91 12345 67890 or +91-1234567890
-            r'\+91[-.\s]?\d{5}[-.\s]?\d{5}',
-            r'\+91[-.\s]?\d{10}',
-            # General international
-            r'\b\d{3}[-.\s]\d{3}[-.\s]\d{4}\b',
-        ]
-        
-        phones = []
-        for pattern in phone_patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                phones.extend(matches)
-                break  # Use the first pattern that finds a match
-        
-        # Clean and format phone numbers
-        if phones:
-            phone = phones[0]
-            if isinstance(phone, tuple):
-                phone = ''.join(filter(None, phone))  # Join tuple and filter empty strings
-            
-            # Remove extra whitespace
-            phone = ' '.join(phone.split())
-            contact['phone'] = phone.strip()
-        else:
-            contact['phone'] = None
-        
-        # LinkedIn extraction - IMPROVED VERSION
-        linkedin_urls = []
-        
-        # Pattern 1: Full URL with http/https
-        full_url_pattern = r'https?://(?:www\.)?linkedin\.com/(?:in|pub)/[\w\-]+'
-        linkedin_urls.extend(re.findall(full_url_pattern, text, re.IGNORECASE))
-        
-        # Pattern 2: URL without protocol
-        if not linkedin_urls:
-            partial_url_pattern = r'(?:www\.)?linkedin\.com/(?:in|pub)/[\w\-]+'
-            partial_matches = re.findall(partial_url_pattern, text, re.IGNORECASE)
-            if partial_matches:
-                # Add https:// prefix if not present
-                linkedin_urls = [f"https://{url}" if not url.startswith('http') else url 
-                               for url in partial_matches]
-        
-        # Pattern 3: Just the username part (linkedin.com/in/username)
-        if not linkedin_urls:
-            username_pattern = r'linkedin\.com/in/([\w\-]+)'
-            username_matches = re.findall(username_pattern, text, re.IGNORECASE)
-            if username_matches:
-                linkedin_urls = [f"https://linkedin.com/in/{username}" 
-                               for username in username_matches]
-        
-        contact['linkedin'] = linkedin_urls[0] if linkedin_urls else None
+        email = EMAIL_RE.search(text)
+        if email:
+            contact['email'] = email.group()
+        
+        # Phone extraction (various formats), using the first pattern that finds a match
+        for pattern in PHONE_RES:
+            phone = pattern.search(text)
+            if phone:
+                # Remove extra whitespace
+                contact['phone'] = ' '.join(phone.group().split())
+                break
+        
+        # LinkedIn extraction, skipped outright when the domain never appears
+        if text_lower is None:
+            text_lower = text.lower()
+        
+        if 'linkedin.com/' in text_lower:
+            for pattern in (LINKEDIN_URL_RE, LINKEDIN_PARTIAL_RE):
+                # Offsets in the lowercased text line up with the original unless
+                # lowercasing lengthened a character, which needs a case-insensitive scan
+                if len(text_lower) == len(text):
+                    linkedin = pattern.search(text_lower)
+                    url = text[linkedin.start():linkedin.end()] if linkedin else None
+                else:
+                    linkedin = re.search(pattern.pattern, text, re.IGNORECASE)
+                    url = linkedin.group() if linkedin else None
+                
+                if url:
+                    # Add https:// prefix if not present
+                    contact['linkedin'] = url if pattern is LINKEDIN_URL_RE else f"https://{url}"
+                    break
         
         return contact
     
-    def extract_skills(self, text):
+    def extract_skills(self, text, text_lower=None):
         """Extract technical and soft skills using keyword matching"""
-        text_lower = text.lower()
-        found_skills = {}
+        if text_lower is None:
+            text_lower = text.lower()
         
-        for category, skills in self.tech_skills.items():
-            found_skills[category] = []
-            for skill in skills:
-                # Use word boundaries to avoid partial matches
-                pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-                if re.search(pattern, text_lower):
-                    found_skills[category].append(skill)
+        # A single scan finds skills from every category at once
+        matched = {match.group(1) for match in SKILL_RE.finditer(text_lower)}
         
-        # Remove empty categories
-        found_skills = {k: v for k, v in found_skills.items() if v}
+        found_skills = {}
+        for category, skills in self.tech_skills.items():
+            category_skills = [skill for skill in skills if skill in matched]
+            if category_skills:
+                found_skills[category] = category_skills
         
         return found_skills
     
-    def extract_experience(self, text):
+    def extract_experience(self, text, doc=None, deep=True, text_lower=None):
         """Extract work experience details using NLP and regex"""
+        if not self.nlp:
+            return self._extract_experience_fallback(text, text_lower)
+        
+        if deep:
+            return self.extract_experience_full(text, doc, text_lower)
+        return self.extract_experience_fast(text, text_lower)
+    
+    def extract_experience_fast(self, text, text_lower=None):
+        """Extract years of experience with regex only, without running NER"""
         experience_data = {
             'total_years': 0,
             'organizations': [],
@@ -148,10 +222,27 @@ class NLPProcessor:
             'experience_sections': []
         }
         
-        if not self.nlp:
-            return self._extract_experience_fallback(text)
+        if text_lower is None:
+            text_lower = text.lower()
         
-        doc = self.nlp(text)
+        # Extract years of experience using various patterns
+        experience_data['total_years'] = min(max(
+            (int(match) for pattern in YEARS_RES for match in pattern.findall(text_lower) if match.isdigit()),
+            default=0
+        ), MAX_TOTAL_YEARS)
+        
+        # If no explicit years mentioned, try to infer from date ranges
+        if experience_data['total_years'] == 0:
+            experience_data['total_years'] = self._infer_experience_from_dates(text, text_lower)
+        
+        return experience_data
+    
+    def extract_experience_full(self, text, doc=None, text_lower=None):
+        """Extract years of experience plus organizations found by NER"""
+        experience_data = self.extract_experience_fast(text, text_lower)
+        
+        if doc is None:
+            doc = self.nlp(text)
         
         # Extract organizations using NER
         organizations = []
@@ -159,35 +250,15 @@ class NLPProcessor:
             if ent.label_ == "ORG" and len(ent.text.strip()) > 2:
                 org = ent.text.strip()
                 # Filter out common false positives
-                if not any(word in org.lower() for word in ['university', 'college', 'school', 'degree']):
+                if not NON_EMPLOYER_ORG_RE.search(org):
                     organizations.append(org)
         
-        experience_data['organizations'] = list(set(organizations))
-        
-        # Extract years of experience using various patterns
-        years_patterns = [
-            r'(\d+)[\s\-]*(?:years?|yrs?)[\s\-]*(?:of\s+)?(?:experience|exp)',
-            r'(?:experience|exp)[\s\-]*(?:of\s+)?(\d+)[\s\-]*(?:years?|yrs?)',
-            r'(\d+)\+?\s*(?:years?|yrs?)',
-        ]
-        
-        years_found = []
-        text_lower = text.lower()
-        
-        for pattern in years_patterns:
-            matches = re.findall(pattern, text_lower)
-            years_found.extend([int(match) for match in matches if match.isdigit()])
-        
-        if years_found:
-            experience_data['total_years'] = max(years_found)
-        
-        # If no explicit years mentioned, try to infer from date ranges
-        if experience_data['total_years'] == 0:
-            experience_data['total_years'] = self._infer_experience_from_dates(text)
+        # Deduplicate, keeping the order organizations appear in
+        experience_data['organizations'] = list(dict.fromkeys(organizations))
         
         return experience_data
     
-    def _extract_experience_fallback(self, text):
+    def _extract_experience_fallback(self, text, text_lower=None):
         """Fallback method when spaCy is not available"""
         experience_data = {
             'total_years': 0,
@@ -197,103 +268,174 @@ class NLPProcessor:
         }
         
         # Simple regex-based experience extraction
-        years_pattern = r'(\d+)[\s-]*(?:years?|yrs?)'
-        years_matches = re.findall(years_pattern, text.lower())
-        
-        if years_matches:
-            experience_data['total_years'] = max([int(y) for y in years_matches])
+        if text_lower is None:
+            text_lower = text.lower()
+        experience_data['total_years'] = min(
+            max((int(y) for y in YEARS_FALLBACK_RE.findall(text_lower)), default=0), MAX_TOTAL_YEARS
+        )
         
         return experience_data
     
-    def _infer_experience_from_dates(self, text):
+    def _infer_experience_from_dates(self, text, text_lower=None):
         """Try to infer total experience from date ranges in resume"""
-        # Look for date patterns like "2020-2023", "Jan 2020 - Dec 2022", etc.
-        date_patterns = [
-            r'(\d{4})\s*[-–]\s*(\d{4})',  # 2020-2023
-            r'(\d{4})\s*[-–]\s*(?:present|current)',  # 2020-present
-            r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s+(\d{4})\s*[-–]\s*(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s+(\d{4})',
-        ]
+        if text_lower is None:
+            text_lower = text.lower()
         
-        current_year = datetime.now().year
-        years_worked = []
+        # Look for date patterns like "2020-2023", "Jan 2020 - Dec 2022", etc.
+        start_years = []
+        end_years = []
         
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text.lower())
+        for pattern in DATE_RANGE_RES:
+            matches = pattern.findall(text_lower)
             for match in matches:
                 if isinstance(match, tuple) and len(match) == 2:
-                    start_year = int(match[0])
-                    end_year = int(match[1]) if match[1].isdigit() else current_year
-                    years_worked.append(end_year - start_year)
-        
-        return max(years_worked) if years_worked else 0
+                    start_years.append(int(match[0]))
+                    end_years.append(int(match[1]) if match[1].isdigit() else 0)
+        
+        return int(max_year_span(
+            np.array(start_years, dtype=np.int32),
+            np.array(end_years, dtype=np.int32),
+            datetime.now().year
+        ))
     
-    def extract_education(self, text):
+    def extract_education(self, text, doc=None, deep=True, text_lower=None):
         """Extract education information"""
         education_data = {
             'has_degree': False,
             'level': None,
+            'level_id': 0,
             'institutions': [],
             'fields': []
         }
         
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         
-        # Education keywords
-        education_keywords = [
-            'bachelor', 'master', 'phd', 'doctorate', 'degree', 'diploma',
-            'university', 'college', 'institute', 'school'
-        ]
-        
-        education_data['has_degree'] = any(keyword in text_lower for keyword in education_keywords)
+        education_data['has_degree'] = any(keyword in text_lower for keyword in EDUCATION_KEYWORDS)
         
         # Degree level detection
-        if 'phd' in text_lower or 'ph.d' in text_lower or 'doctorate' in text_lower:
-            education_data['level'] = 'PhD'
-        elif 'master' in text_lower or 'mba' in text_lower or 'm.s' in text_lower or 'm.a' in text_lower:
-            education_data['level'] = 'Masters'
-        elif 'bachelor' in text_lower or 'b.s' in text_lower or 'b.a' in text_lower or 'b.tech' in text_lower:
-            education_data['level'] = 'Bachelors'
-        elif 'associate' in text_lower:
-            education_data['level'] = 'Associates'
-        
-        # Extract institutions using NER if available
-        if self.nlp:
-            doc = self.nlp(text)
+        for level, markers in DEGREE_LEVELS:
+            if any(marker in text_lower for marker in markers):
+                education_data['level'] = level
+                education_data['level_id'] = LEVEL_ID[level]
+                break
+        
+        # Extract institutions using NER if available; without any education
+        # keyword in the text no entity could pass the institution filter
+        if self.nlp and deep and education_data['has_degree']:
+            if doc is None:
+                doc = self.nlp(text)
             for ent in doc.ents:
-                if ent.label_ == "ORG":
-                    org_text = ent.text.lower()
-                    if any(edu_word in org_text for edu_word in ['university', 'college', 'institute', 'school']):
-                        education_data['institutions'].append(ent.text)
+                if ent.label_ == "ORG" and INSTITUTION_ORG_RE.search(ent.text):
+                    education_data['institutions'].append(ent.text)
         
         return education_data
     
-    def process_resume(self, text):
+    def _empty_result(self):
+        """Return empty processing result for unreadable or failed resumes"""
+        result = {
+            'contact_info': {'email': None, 'phone': None, 'linkedin': None},
+            'skills': {},
+            'skills_flat_set': frozenset(),
+            'skills_bits': 0,
+            'total_skills': 0,
+            'experience': {'total_years': 0, 'organizations': [], 'job_titles': []},
+            'education': {'has_degree': False, 'level': None, 'level_id': 0}
+        }
+        result['quality_features'] = quality_features(result)
+        return result
+    
+    def _build_result(self, text, doc, deep=True):
+        """Extract all information from a resume, reusing its spaCy Doc"""
+        # Lowercased once and shared by the regex-based extractors
+        text_lower = text.lower()
+        contact_info = self.extract_contact_info(text, text_lower)
+        skills = self.extract_skills(text, text_lower)
+        # Normalized once here so scoring does not re-flatten the categories per job
+        skills_flat_set = frozenset(
+            normalize_skill(skill) for category_skills in skills.values() for skill in category_skills
+        )
+        result = {
+            'contact_info': contact_info,
+            'skills': skills,
+            'skills_flat_set': skills_flat_set,
+            # Bitmask over SKILL_VOCAB ids; skill matching is an AND and a popcount
+            'skills_bits': skill_bits(skills_flat_set),
+            'total_skills': sum(len(category_skills) for category_skills in skills.values()),
+            'experience': self.extract_experience(text, doc, deep, text_lower),
+            'education': self.extract_education(text, doc, deep, text_lower),
+            'text_length': len(text),
+            'word_count': len(text.split())
+        }
+        # Flat record of the fields resume quality scoring reads
+        result['quality_features'] = quality_features(result)
+        return result
+    
+    def _text_key(self, text, deep):
+        """Short content hash of a resume text used as the result cache key"""
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest(), deep
+    
+    def process_resume(self, text, deep=True):
         """Main processing function that extracts all information"""
+        # deep=False skips NER: much faster, but organizations and institutions stay empty
         if not text or len(text.strip()) < 50:
-            return {
-                'contact_info': {'email': None, 'phone': None, 'linkedin': None},
-                'skills': {},
-                'experience': {'total_years': 0, 'organizations': [], 'job_titles': []},
-                'education': {'has_degree': False, 'level': None}
-            }
+            return self._empty_result()
+        
+        key = self._text_key(text, deep)
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            return cached
         
         try:
-            processed_data = {
-                'contact_info': self.extract_contact_info(text),
-                'skills': self.extract_skills(text),
-                'experience': self.extract_experience(text),
-                'education': self.extract_education(text),
-                'text_length': len(text),
-                'word_count': len(text.split())
-            }
-            
-            return processed_data
+            # Run the spaCy pipeline once and share the Doc between extractors
+            doc = self.nlp(text) if self.nlp and deep else None
+            result = self._build_result(text, doc, deep)
             
         except Exception as e:
             print(f"Error processing resume: {str(e)}")
-            return {
-                'contact_info': {'email': None, 'phone': None, 'linkedin': None},
-                'skills': {},
-                'experience': {'total_years': 0, 'organizations': [], 'job_titles': []},
-                'education': {'has_degree': False, 'level': None}
-            }
+            return self._empty_result()
+        
+        self._result_cache.put(key, result)
+        return result
+    
+    def process_resumes(self, texts, n_process=SPACY_N_PROCESS, deep=True):
+        """Process several resumes, batching the spaCy pass with nlp.pipe"""
+        results = [self._empty_result() for _ in texts]
+        valid = []
+        keys = {}
+        for i, text in enumerate(texts):
+            if not text or len(text.strip()) < 50:
+                continue
+            keys[i] = self._text_key(text, deep)
+            cached = self._result_cache.get(keys[i])
+            if cached is not None:
+                results[i] = cached
+            else:
+                valid.append(i)
+        
+        # Starting worker processes only pays off when there is more than one batch,
+        # and only forked workers share the loaded model copy-on-write; spawned
+        # ones would each unpickle their own copy of the whole pipeline
+        if len(valid) <= SPACY_BATCH_SIZE or not _workers_are_forked():
+            n_process = 1
+        
+        if self.nlp and deep:
+            docs = self.nlp.pipe(
+                (texts[i] for i in valid),
+                batch_size=SPACY_BATCH_SIZE,
+                n_process=n_process
+            )
+        else:
+            docs = (None for _ in valid)
+        
+        try:
+            for i, doc in zip(valid, docs):
+                try:
+                    results[i] = self._build_result(texts[i], doc, deep)
+                    self._result_cache.put(keys[i], results[i])
+                except Exception as e:
+                    print(f"Error processing resume: {str(e)}")
+        except Exception as e:
+            print(f"Error processing resumes: {str(e)}")
+        
+        return results
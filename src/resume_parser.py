@@ -1,83 +1,125 @@
+import fitz  # PyMuPDF
 import PyPDF2
 import pdfplumber
 from docx import Document
 import re
 import io
+import hashlib
+import threading
+from .cache import LRUCache
+
+# Spans kept verbatim by clean_text, highest priority first: URLs (LinkedIn
+# profiles also without protocol), email addresses, then phone number formats
+PROTECT_RES = [
+    re.compile(r'https?://[^\s]+|(?i:(?:www\.)?linkedin\.com/(?:in|pub)/[\w\-]+)'),
+    re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
+    re.compile('|'.join([
+        r'\+\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9}',
+        r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
+        r'\d{3}\.\d{3}\.\d{4}',
+        r'\d{3}-\d{3}-\d{4}',
+        r'\b\d{10}\b',
+    ])),
+]
+
+# Runs of whitespace and characters other than letters, digits, @ . - _ + ( )
+JUNK_RE = re.compile(r'[^\w@.\-+()]+')
+
+# Parsed texts kept per parser, keyed by a hash of the uploaded bytes
+TEXT_CACHE_SIZE = 128
+
+# PyMuPDF does not support multithreaded use, and the cached parser is shared
+# by every Streamlit session thread
+_FITZ_LOCK = threading.Lock()
 
 class ResumeParser:
     """Class to handle resume parsing from PDF and DOCX files"""
     
     def __init__(self):
-        pass
+        # Re-uploads and Streamlit reruns of the same file skip PDF/DOCX parsing
+        self._text_cache = LRUCache(TEXT_CACHE_SIZE)
+    
+    def _read_bytes(self, file_obj):
+        """Read an uploaded file-like object into memory once"""
+        if isinstance(file_obj, (bytes, bytearray)):
+            return bytes(file_obj)
+        file_obj.seek(0)
+        return file_obj.read()
     
     def extract_text_from_pdf(self, pdf_file):
-        """Extract text from PDF using pdfplumber for better formatting"""
+        """Extract text from PDF using PyMuPDF, falling back to pdfplumber and PyPDF2"""
+        # Uploaded files are parsed from their in-memory bytes, file paths are opened directly
+        if hasattr(pdf_file, 'read'):
+            pdf_file = self._read_bytes(pdf_file)
+        in_memory = isinstance(pdf_file, (bytes, bytearray))
+        
         text = ""
         try:
-            # If it's a file-like object (Streamlit upload), use it directly
-            if hasattr(pdf_file, 'read'):
-                with pdfplumber.open(io.BytesIO(pdf_file.read())) as pdf:
-                    for page in pdf.pages:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
-            else:
-                # If it's a file path
-                with pdfplumber.open(pdf_file) as pdf:
+            with _FITZ_LOCK:
+                if in_memory:
+                    doc = fitz.open(stream=pdf_file, filetype="pdf")
+                else:
+                    doc = fitz.open(pdf_file)
+                
+                with doc:
+                    text = "\n".join(page.get_text("text") for page in doc)
+        except Exception as e:
+            print(f"Error extracting PDF text with PyMuPDF: {str(e)}")
+        
+        # Fallback to pdfplumber, also when PyMuPDF found no text (e.g. unusual font encodings)
+        if not text.strip():
+            try:
+                with pdfplumber.open(io.BytesIO(pdf_file) if in_memory else pdf_file) as pdf:
+                    pages = []
                     for page in pdf.pages:
-                        page_text = page.extract_text()
+                        page_text = page.extract_text(x_tolerance=3, y_tolerance=3)
                         if page_text:
-                            text += page_text + "\n"
-        except Exception as e:
-            print(f"Error extracting PDF text: {str(e)}")
-            # Fallback to PyPDF2
+                            pages.append(page_text)
+                        # Release the page's parsed layout objects before the next one
+                        page.close()
+                    text = "\n".join(pages)
+            except Exception as e:
+                print(f"Error extracting PDF text: {str(e)}")
+        
+        # Last resort: PyPDF2
+        if not text.strip():
             try:
-                if hasattr(pdf_file, 'read'):
-                    pdf_file.seek(0)  # Reset file pointer
-                    reader = PyPDF2.PdfReader(io.BytesIO(pdf_file.read()))
-                else:
-                    reader = PyPDF2.PdfReader(pdf_file)
-                
-                for page in reader.pages:
-                    text += page.extract_text() + "\n"
-            except Exception as e2:
-                print(f"Fallback PDF extraction also failed: {str(e2)}")
+                reader = PyPDF2.PdfReader(io.BytesIO(pdf_file) if in_memory else pdf_file)
+                # Pages without a text layer can yield None rather than ""
+                text = "\n".join(page.extract_text() or "" for page in reader.pages)
+            except Exception as e:
+                print(f"Fallback PDF extraction also failed: {str(e)}")
                 return ""
         
         return text
     
     def extract_text_from_docx(self, docx_file):
         """Extract text from Word document"""
-        text = ""
         try:
             if hasattr(docx_file, 'read'):
+                docx_file = self._read_bytes(docx_file)
+            
+            if isinstance(docx_file, (bytes, bytearray)):
                 # Streamlit uploaded file
-                doc = Document(io.BytesIO(docx_file.read()))
+                doc = Document(io.BytesIO(docx_file))
             else:
                 # File path
                 doc = Document(docx_file)
             
             # Extract text from paragraphs
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            
-            # Also extract hyperlinks from the document
-            # Many resumes have LinkedIn as a hyperlink
-            for paragraph in doc.paragraphs:
-                for run in paragraph.runs:
-                    if run.element.tag.endswith('hyperlink') or 'hyperlink' in str(run.element.xml):
-                        # Try to extract hyperlink URL
-                        pass
+            parts = [paragraph.text for paragraph in doc.paragraphs]
             
-            # Try to extract from document relationships (where hyperlinks are stored)
+            # Many resumes have LinkedIn as a hyperlink, whose URL is only stored
+            # in the document relationships
             try:
-                for rel in doc.part.rels.values():
-                    if "hyperlink" in rel.reltype:
-                        url = rel.target_ref
-                        if 'linkedin' in url.lower():
-                            text += f"\n{url}\n"
+                parts.extend(
+                    rel.target_ref for rel in doc.part.rels.values()
+                    if "hyperlink" in rel.reltype and 'linkedin' in rel.target_ref.lower()
+                )
             except:
                 pass
+            
+            text = "\n".join(parts)
                 
         except Exception as e:
             print(f"Error extracting DOCX text: {str(e)}")
@@ -90,82 +132,54 @@ class ResumeParser:
         if not text:
             return ""
         
-        # First, protect URLs and email addresses by temporarily replacing them
-        url_pattern = r'https?://[^\s]+'
-        urls = re.findall(url_pattern, text)
-        url_placeholders = {}
-        for i, url in enumerate(urls):
-            placeholder = f"__URL_{i}__"
-            url_placeholders[placeholder] = url
-            text = text.replace(url, placeholder)
-        
-        # Protect LinkedIn URLs without protocol
-        linkedin_pattern = r'(?:www\.)?linkedin\.com/(?:in|pub)/[\w\-]+'
-        linkedin_urls = re.findall(linkedin_pattern, text, re.IGNORECASE)
-        for i, url in enumerate(linkedin_urls):
-            placeholder = f"__LINKEDIN_{i}__"
-            url_placeholders[placeholder] = url
-            text = text.replace(url, placeholder)
-        
-        # Protect email addresses
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        email_placeholders = {}
-        for i, email in enumerate(emails):
-            placeholder = f"__EMAIL_{i}__"
-            email_placeholders[placeholder] = email
-            text = text.replace(email, placeholder)
-        
-        # Protect phone numbers
-        phone_patterns = [
-            r'\+\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9}',
-            r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-            r'\d{3}\.\d{3}\.\d{4}',
-            r'\d{3}-\d{3}-\d{4}',
-            r'\b\d{10}\b',
-        ]
-        phone_placeholders = {}
-        for i, pattern in enumerate(phone_patterns):
-            phones = re.findall(pattern, text)
-            for j, phone in enumerate(phones):
-                placeholder = f"__PHONE_{i}_{j}__"
-                phone_placeholders[placeholder] = phone
-                text = text.replace(phone, placeholder)
-        
-        # Now clean the text
-        # Remove extra whitespace but keep single spaces
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove special characters but keep important ones
-        # Keep: letters, numbers, spaces, @, ., -, _, +, (, ), and our placeholders
-        text = re.sub(r'[^\w\s@.\-_+()]', ' ', text)
-        
-        # Remove multiple spaces
-        text = re.sub(r' +', ' ', text)
-        
-        # Restore URLs
-        for placeholder, url in url_placeholders.items():
-            text = text.replace(placeholder, url)
-        
-        # Restore emails
-        for placeholder, email in email_placeholders.items():
-            text = text.replace(placeholder, email)
-        
-        # Restore phone numbers
-        for placeholder, phone in phone_placeholders.items():
-            text = text.replace(placeholder, phone)
+        text = self._clean_segment(text)
         
         return text.strip()
     
+    def _clean_segment(self, text, tier=0):
+        """Keep protected spans verbatim and collapse junk in the gaps between them"""
+        # Gaps are searched again for the next, lower-priority kind of span
+        if tier == len(PROTECT_RES):
+            return JUNK_RE.sub(' ', text)
+        
+        parts = []
+        position = 0
+        for match in PROTECT_RES[tier].finditer(text):
+            parts.append(self._clean_segment(text[position:match.start()], tier + 1))
+            parts.append(match.group())
+            position = match.end()
+        parts.append(self._clean_segment(text[position:], tier + 1))
+        return "".join(parts)
+    
     def parse_resume(self, uploaded_file):
         """Main parsing function for Streamlit uploaded files"""
         try:
-            file_extension = uploaded_file.name.split('.')[-1].lower()
+            # Read the upload once and parse it in memory
+            data = self._read_bytes(uploaded_file)
+        except Exception as e:
+            print(f"Error parsing resume: {str(e)}")
+            return ""
+        
+        return self.parse_bytes(data, uploaded_file.name)
+    
+    def _bytes_key(self, data, file_extension):
+        """Short content hash of the raw file bytes used as the text cache key"""
+        return hashlib.blake2b(data, digest_size=16).digest(), file_extension
+    
+    def parse_bytes(self, data, filename):
+        """Parse raw resume file bytes, using the filename to pick the format"""
+        try:
+            file_extension = filename.split('.')[-1].lower()
+            
+            key = self._bytes_key(data, file_extension)
+            cached = self._text_cache.get(key)
+            if cached is not None:
+                return cached
             
             if file_extension == 'pdf':
-                text = self.extract_text_from_pdf(uploaded_file)
+                text = self.extract_text_from_pdf(data)
             elif file_extension in ['docx', 'doc']:
-                text = self.extract_text_from_docx(uploaded_file)
+                text = self.extract_text_from_docx(data)
             else:
                 raise ValueError(f"Unsupported file format: {file_extension}")
             
@@ -181,6 +195,7 @@ class ResumeParser:
             print(cleaned_text[:500])
             print("===========================")
             
+            self._text_cache.put(key, cleaned_text)
             return cleaned_text
             
         except Exception as e:
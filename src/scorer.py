@@ -1,5 +1,167 @@
-import math
-from collections import Counter
+import bisect
+import functools
+import operator
+import threading
+from dataclasses import dataclass
+import numpy as np
+from .skills import LEVEL_ID, SKILL_VOCAB, normalize_skill, skill_bits
+from .scorer_kernels import HAS_NUMBA, experience_score, education_score, score_batch
+
+# Education hierarchy rank per LEVEL_ID: Associates 1, Bachelors 2, Masters and MBA 3, PhD 4
+LEVEL_SCORES = (0, 1, 2, 3, 3, 4)
+LEVEL_SCORE_LUT = np.array(LEVEL_SCORES, dtype=np.int8)
+
+# Hiring recommendation per overall score bucket: below 0.4, from 0.4, from 0.6, from 0.8
+RECOMMENDATION_THRESHOLDS = (0.4, 0.6, 0.8)
+RECOMMENDATIONS = (
+    "Weak Candidate - Consider Rejection",
+    "Moderate Candidate - Review Carefully",
+    "Good Candidate - Consider for Interview",
+    "Strong Candidate - Recommend for Interview"
+)
+_THRESHOLD_ARRAY = np.array(RECOMMENDATION_THRESHOLDS)
+_RECOMMENDATION_ARRAY = np.array(RECOMMENDATIONS, dtype=object)
+
+# Flat per-resume inputs of score_resume_quality, stacked into (N,) arrays for batches
+QUALITY_DTYPE = np.dtype([
+    ('text_length', np.int64),
+    ('word_count', np.int64),
+    ('has_email', np.bool_),
+    ('has_phone', np.bool_),
+    ('has_linkedin', np.bool_),
+    ('total_skills', np.int64),
+    ('num_skill_cats', np.int64),
+    # float64: years can be fractional, and an int64 field would truncate 0.5 to 0
+    ('total_years', np.float64),
+    ('has_orgs', np.bool_)
+])
+
+# Numba's default workqueue threading layer must not run parallel kernels from
+# several threads at once, and Streamlit serves each session on its own thread
+_SCORE_BATCH_LOCK = threading.Lock()
+
+# One row per resume from ResumeScorer.calculate_overall_scores_batch
+SCORE_DTYPE = np.dtype([
+    ('overall_score', np.float64),
+    ('score_percentage', np.float64),
+    ('skills_match', np.float64),
+    ('experience_years', np.float64),
+    ('education', np.float64),
+    ('resume_quality', np.float64),
+    ('recommendation', object)
+])
+
+# Component order of ScoreResult.component_scores, the same as ResumeScorer.weights
+COMPONENTS = ('skills_match', 'experience_years', 'education', 'resume_quality')
+
+@dataclass(slots=True)
+class ScoreResult:
+    """Weighted score of one resume with its component scores, feedback and recommendation"""
+    overall_score: float
+    component_scores: tuple  # in COMPONENTS order
+    score_percentage: float
+    feedback: tuple          # (component, message) pairs, shared between equal feedback
+    recommendation: str
+    
+    def to_dict(self):
+        """Return the result as the dict the app renders and exports"""
+        return {
+            'overall_score': self.overall_score,
+            'component_scores': dict(zip(COMPONENTS, self.component_scores)),
+            'score_percentage': self.score_percentage,
+            'feedback': dict(self.feedback),
+            'recommendation': self.recommendation
+        }
+
+@functools.lru_cache(maxsize=256)
+def _norm_skillset(skills):
+    """Vocabulary bitmask and the remaining normalized names of a hashable collection of skills"""
+    names = frozenset(map(normalize_skill, skills))
+    return skill_bits(names), names - SKILL_VOCAB.keys()
+
+@functools.lru_cache(maxsize=128)
+def _requirement_skillsets(required_skills, nice_to_have_skills):
+    """Required and nice-to-have skill bitmasks of one job, normalized once per distinct job"""
+    required_names = frozenset(map(normalize_skill, required_skills))
+    nice_to_have_names = frozenset(map(normalize_skill, nice_to_have_skills))
+    # Requirement skills outside the taxonomy get bits above SKILL_VOCAB that only
+    # exist for this job, so they count in the denominators without growing the
+    # vocabulary; a resume given as skill names can still match them
+    unknown = sorted((required_names | nice_to_have_names) - SKILL_VOCAB.keys())
+    extra_ids = {name: len(SKILL_VOCAB) + offset for offset, name in enumerate(unknown)}
+    return skill_bits(required_names, extra_ids), skill_bits(nice_to_have_names, extra_ids), extra_ids
+
+def quality_features(processed_data):
+    """Build the QUALITY_DTYPE record of a processed resume"""
+    contact = processed_data.get('contact_info', {})
+    skills = processed_data.get('skills', {})
+    experience = processed_data.get('experience', {})
+    return np.array((
+        processed_data.get('text_length', 0),
+        processed_data.get('word_count', 0),
+        bool(contact.get('email')),
+        bool(contact.get('phone')),
+        bool(contact.get('linkedin')),
+        sum(len(skill_list) for skill_list in skills.values()),
+        len(skills),
+        experience.get('total_years', 0),
+        bool(experience.get('organizations'))
+    ), dtype=QUALITY_DTYPE)
+
+def _level_id(education_info):
+    """LEVEL_ID of an education dict, derived from the level name for results without level_id"""
+    level_id = education_info.get('level_id')
+    if level_id is None:
+        level = education_info.get('level')
+        # Unrecognized level names rank like an Associates degree
+        level_id = LEVEL_ID.get(level, 1) if level else 0
+    return level_id
+
+def _bits_to_words(bits_list, width):
+    """Split skill bitmasks into an (N, width) array of little-endian uint64 words"""
+    data = b''.join(bits.to_bytes(width * 8, 'little') for bits in bits_list)
+    return np.frombuffer(data, dtype='<u8').reshape(len(bits_list), width)
+
+def _match_fraction(required_bits, resume_bits):
+    """Fraction of the required skill bits that are set in the resume bits"""
+    return (required_bits & resume_bits).bit_count() / required_bits.bit_count()
+
+def _feedback_bucket(score):
+    """Feedback tier of a component score: 0 below 0.5, 1 below 0.8, else 2"""
+    # Counted down from the top tier so a NaN score lands where the if/elif chain put it
+    return 2 - (score < 0.5) - (score < 0.8)
+
+# typed: 5 and 5.0 years hash alike but format differently
+@functools.lru_cache(maxsize=4096, typed=True)
+def _feedback_messages(skills_bucket, exp_bucket, years, required, edu_bucket, edu_level, quality_bucket):
+    """Feedback strings for one combination of score tiers, years and education level"""
+    if skills_bucket == 0:
+        skills = "Consider adding more relevant technical skills mentioned in the job description."
+    elif skills_bucket == 1:
+        skills = "Good skill match, but could be improved by learning additional required skills."
+    else:
+        skills = "Excellent skill match with job requirements."
+    
+    if exp_bucket == 0:
+        experience = f"Experience ({years} years) is below the required {required} years."
+    elif exp_bucket == 1:
+        experience = f"Experience ({years} years) meets basic requirements."
+    else:
+        experience = f"Excellent experience level ({years} years) for this role."
+    
+    if edu_bucket == 0:
+        education = f"Education level ({edu_level}) may not meet job requirements."
+    else:
+        education = f"Education level ({edu_level}) is appropriate for this role."
+    
+    if quality_bucket == 0:
+        quality = "Resume could be improved with more complete contact information and better formatting."
+    elif quality_bucket == 1:
+        quality = "Resume quality is good but could be enhanced."
+    else:
+        quality = "Excellent resume quality and completeness."
+    
+    return (('skills', skills), ('experience', experience), ('education', education), ('quality', quality))
 
 class ResumeScorer:
     """Class to score resumes based on job requirements"""
@@ -13,84 +175,77 @@ class ResumeScorer:
             'resume_quality': 0.15    # 15% weight on resume quality
         }
         
+        # Weights prebuilt in component order for the weighted sums
+        self._component_order = tuple(self.weights)
+        self._weight_values = tuple(self.weights[component] for component in self._component_order)
+        self._weight_vec = np.array(self._weight_values)
+        
         # Minimum thresholds for scoring
         self.min_text_length = 100
         self.min_word_count = 20
+        
+        # Compile the scoring kernels now rather than on the first resume
+        experience_score(0.0, 0.0, False, 0.0)
+        education_score(0, 0, 0)
+        self.calculate_overall_scores_batch([])
     
     def score_skills_match(self, resume_skills, required_skills, nice_to_have_skills=None):
         """Score based on skill matching with required and nice-to-have skills"""
         if not required_skills and not nice_to_have_skills:
             return 0.5  # Neutral score if no requirements
         
-        # Flatten resume skills into a single list
-        resume_skill_list = []
-        for category, skills in resume_skills.items():
-            resume_skill_list.extend([skill.lower().strip() for skill in skills])
-        
-        resume_skill_set = set(resume_skill_list)
-        
-        # Process required skills
-        required_skill_list = [skill.lower().strip() for skill in (required_skills or [])]
-        required_skill_set = set(required_skill_list)
-        
-        # Process nice-to-have skills
-        nice_to_have_skill_list = [skill.lower().strip() for skill in (nice_to_have_skills or [])]
-        nice_to_have_skill_set = set(nice_to_have_skill_list)
-        
-        # Calculate matches
-        required_matches = len(resume_skill_set & required_skill_set)
-        nice_to_have_matches = len(resume_skill_set & nice_to_have_skill_set)
+        # Map normalized skill names to bitmasks over the skill vocabulary
+        required_skill_bits, nice_to_have_skill_bits, extra_skill_ids = _requirement_skillsets(
+            tuple(required_skills or ()), tuple(nice_to_have_skills or ())
+        )
+        resume_skill_bits = self._resume_skill_bits(resume_skills, extra_skill_ids)
         
         # Score calculation
         required_score = 0
-        if required_skill_set:
-            required_score = required_matches / len(required_skill_set)
+        if required_skill_bits:
+            required_score = _match_fraction(required_skill_bits, resume_skill_bits)
         
         nice_to_have_score = 0
-        if nice_to_have_skill_set:
-            nice_to_have_score = nice_to_have_matches / len(nice_to_have_skill_set)
+        if nice_to_have_skill_bits:
+            nice_to_have_score = _match_fraction(nice_to_have_skill_bits, resume_skill_bits)
         
         # Weighted combination (required skills more important)
-        if required_skill_set and nice_to_have_skill_set:
+        if required_skill_bits and nice_to_have_skill_bits:
             final_score = (required_score * 0.8) + (nice_to_have_score * 0.2)
-        elif required_skill_set:
+        elif required_skill_bits:
             final_score = required_score
-        elif nice_to_have_skill_set:
+        elif nice_to_have_skill_bits:
             final_score = nice_to_have_score
         else:
             final_score = 0.5
         
-        return min(final_score, 1.0)
+        # Fractions of at most 1 weighted 0.8 and 0.2 round to at most 1.0, no clamp needed
+        return final_score
+    
+    def _resume_skills(self, processed_data):
+        """Most prebuilt form of a processed resume's skills available for score_skills_match"""
+        if 'skills_bits' in processed_data:
+            return processed_data['skills_bits']
+        return processed_data.get('skills_flat_set') or processed_data.get('skills', {})
+    
+    def _resume_skill_bits(self, resume_skills, extra_skill_ids):
+        """Skill bitmask from the prebuilt skills_bits, the skills_flat_set or the per-category dict"""
+        # Prebuilt bitmasks come from extracted, in-taxonomy skills only
+        if isinstance(resume_skills, int):
+            return resume_skills
+        if isinstance(resume_skills, dict):
+            resume_skills = frozenset(skill for skills in resume_skills.values() for skill in skills)
+        bits, unknown = _norm_skillset(resume_skills)
+        if unknown and extra_skill_ids:
+            bits |= skill_bits(unknown, extra_skill_ids)
+        return bits
     
     def score_experience(self, years_experience, required_years=0, preferred_years=None):
         """Score based on years of experience with required and preferred thresholds"""
-        if years_experience < 0:
-            return 0.0
-        
-        # If no experience requirements, give neutral score
-        if required_years == 0 and not preferred_years:
-            return 0.5
-        
-        # Score based on meeting requirements
-        if years_experience >= required_years:
-            base_score = 0.7  # Base score for meeting requirements
-            
-            # Bonus for exceeding requirements
-            if preferred_years and years_experience >= preferred_years:
-                base_score = 1.0
-            elif years_experience > required_years:
-                # Diminishing returns for extra experience
-                excess = years_experience - required_years
-                bonus = min(0.3, excess * 0.05)  # Max 0.3 bonus
-                base_score = min(1.0, base_score + bonus)
-            
-            return base_score
-        else:
-            # Penalty for not meeting requirements
-            if required_years > 0:
-                return years_experience / required_years * 0.6  # Max 60% if below requirements
-            else:
-                return 0.5
+        return experience_score(
+            float(years_experience), float(required_years),
+            bool(preferred_years), float(preferred_years or 0)
+        )
     
     def score_education(self, education_info, required_level=None, preferred_level=None):
         """Score based on education level"""
@@ -100,201 +255,433 @@ class ResumeScorer:
             else:
                 return 0.6  # Neutral-low if no degree required
         
-        # Education level hierarchy
-        education_hierarchy = {
-            'Associates': 1,
-            'Bachelors': 2,
-            'Masters': 3,
-            'MBA': 3,
-            'PhD': 4
-        }
-        
-        current_level = education_info.get('level')
-        if not current_level:
+        current_score = LEVEL_SCORES[_level_id(education_info)]
+        if not current_score:
             return 0.5  # Neutral if degree detected but level unclear
         
-        current_score = education_hierarchy.get(current_level, 1)
-        
         # If no requirements specified, score based on level
         if not required_level and not preferred_level:
-            return min(current_score / 4.0, 1.0)  # Normalize to 0-1
+            return current_score / 4.0  # Normalize to 0-1, 4 being the highest rank
         
-        required_score = education_hierarchy.get(required_level, 0) if required_level else 0
-        preferred_score = education_hierarchy.get(preferred_level, 0) if preferred_level else 0
+        required_score = LEVEL_SCORES[LEVEL_ID.get(required_level, 0)]
+        preferred_score = LEVEL_SCORES[LEVEL_ID.get(preferred_level, 0)]
         
         # Score based on meeting requirements
-        if current_score >= required_score:
-            base_score = 0.7
-            if preferred_score and current_score >= preferred_score:
-                base_score = 1.0
-            elif current_score > required_score:
-                bonus = min(0.3, (current_score - required_score) * 0.15)
-                base_score = min(1.0, base_score + bonus)
-            return base_score
-        else:
-            # Penalty for not meeting education requirements
-            return current_score / max(required_score, 1) * 0.6
+        return education_score(current_score, required_score, preferred_score)
     
     def score_resume_quality(self, processed_data):
         """Score overall resume quality and completeness"""
-        quality_score = 0.0
+        features = self._resume_quality_features(processed_data)
+        (text_length, word_count, has_email, has_phone, has_linkedin,
+         total_skills, num_skill_cats, total_years, has_orgs) = features.item()
         
         # Check text length and word count
-        text_length = processed_data.get('text_length', 0)
-        word_count = processed_data.get('word_count', 0)
-        
         if text_length < self.min_text_length or word_count < self.min_word_count:
             return 0.1  # Very low score for insufficient content
         
-        # Contact information completeness
-        contact = processed_data.get('contact_info', {})
-        if contact.get('email'):
-            quality_score += 0.25
-        if contact.get('phone'):
-            quality_score += 0.15
-        if contact.get('linkedin'):
-            quality_score += 0.10
-        
-        # Skills section presence and diversity
-        skills = processed_data.get('skills', {})
-        total_skills = sum(len(skill_list) for skill_list in skills.values())
-        
-        if total_skills > 0:
-            quality_score += 0.15
-            # Bonus for skill diversity
-            if len(skills) > 2:  # Multiple skill categories
-                quality_score += 0.10
-        
-        # Experience information
-        experience = processed_data.get('experience', {})
-        if experience.get('total_years', 0) > 0:
-            quality_score += 0.15
-        
-        if experience.get('organizations'):
-            quality_score += 0.10
-        
-        return min(quality_score, 1.0)
-    
-    def calculate_overall_score(self, processed_data, job_requirements=None):
-        """Calculate final weighted score with detailed breakdown"""
-        if not processed_data:
-            return self._empty_score_result()
+        # Contact information completeness, skills presence and diversity (multiple
+        # skill categories), then experience information
+        quality_score = (
+            0.0
+            + 0.25 * has_email
+            + 0.15 * has_phone
+            + 0.10 * has_linkedin
+            + 0.15 * (total_skills > 0)
+            + 0.10 * (total_skills > 0 and num_skill_cats > 2)
+            + 0.15 * (total_years > 0)
+            + 0.10 * has_orgs
+        )
         
-        job_requirements = job_requirements or {}
+        # The weights sum to exactly 1.0, so the score needs no clamp
+        return quality_score
+    
+    def _resume_quality_features(self, processed_data):
+        """Prebuilt quality_features record of a processed resume, built here for results without one"""
+        features = processed_data.get('quality_features')
+        if features is None:
+            features = quality_features(processed_data)
+        return features
+    
+    def _score_quality_batch(self, processed_list):
+        """Vectorized score_resume_quality over a list of processed resumes"""
+        features = np.array(
+            [self._resume_quality_features(data).item() for data in processed_list],
+            dtype=QUALITY_DTYPE
+        )
         
-        # Calculate individual component scores
-        skills_score = self.score_skills_match(
-            processed_data.get('skills', {}),
-            job_requirements.get('required_skills', []),
-            job_requirements.get('nice_to_have_skills', [])
+        has_skills = features['total_skills'] > 0
+        quality_scores = (
+            0.0
+            + 0.25 * features['has_email']
+            + 0.15 * features['has_phone']
+            + 0.10 * features['has_linkedin']
+            + 0.15 * has_skills
+            + 0.10 * (has_skills & (features['num_skill_cats'] > 2))
+            + 0.15 * (features['total_years'] > 0)
+            + 0.10 * features['has_orgs']
         )
         
-        experience_score = self.score_experience(
-            processed_data.get('experience', {}).get('total_years', 0),
+        insufficient = (features['text_length'] < self.min_text_length) | (features['word_count'] < self.min_word_count)
+        return np.where(insufficient, 0.1, quality_scores)
+    
+    def _prepare_job(self, job_requirements):
+        """Normalize job requirements into the per-job constants tuple of _score_all"""
+        required_level = job_requirements.get('education_level')
+        preferred_level = job_requirements.get('preferred_education_level')
+        required_skill_bits, nice_to_have_skill_bits, extra_skill_ids = _requirement_skillsets(
+            tuple(job_requirements.get('required_skills') or ()),
+            tuple(job_requirements.get('nice_to_have_skills') or ())
+        )
+        # A plain tuple: building a namedtuple costs more than the rest of this method
+        return (
+            required_skill_bits,
+            nice_to_have_skill_bits,
+            extra_skill_ids,
             job_requirements.get('min_experience', 0),
-            job_requirements.get('preferred_experience')
+            job_requirements.get('preferred_experience'),
+            bool(required_level),
+            bool(required_level or preferred_level),
+            LEVEL_SCORES[LEVEL_ID.get(required_level, 0)],
+            LEVEL_SCORES[LEVEL_ID.get(preferred_level, 0)]
         )
+    
+    def _score_all(self, processed_data, education, years, job):
+        """Skills, experience, education and quality scores of one resume in a single pass"""
+        # Same rules as the score_* methods, unpacking each input once
+        (required_skill_bits, nice_to_have_skill_bits, extra_skill_ids, required_years, preferred_years,
+         degree_required, has_education_requirement, required_score, preferred_score) = job
+        (text_length, word_count, has_email, has_phone, has_linkedin,
+         total_skills, num_skill_cats, total_years, has_orgs) = self._resume_quality_features(processed_data).item()
+        
+        # Skills: required skills weigh 0.8 next to nice-to-have ones, neutral without requirements
+        skills_score = 0.5
+        if required_skill_bits or nice_to_have_skill_bits:
+            resume_skill_bits = self._resume_skill_bits(self._resume_skills(processed_data), extra_skill_ids)
+            if required_skill_bits and nice_to_have_skill_bits:
+                skills_score = (
+                    _match_fraction(required_skill_bits, resume_skill_bits) * 0.8
+                    + _match_fraction(nice_to_have_skill_bits, resume_skill_bits) * 0.2
+                )
+            elif required_skill_bits:
+                skills_score = _match_fraction(required_skill_bits, resume_skill_bits)
+            elif nice_to_have_skill_bits:
+                skills_score = _match_fraction(nice_to_have_skill_bits, resume_skill_bits)
+        
+        # Experience and education inline the experience_score and education_score kernels:
+        # for a single resume a kernel dispatch costs more than the arithmetic. Meeting a
+        # requirement exactly adds a zero bonus to the 0.7 base.
+        if years < 0:
+            experience_result = 0.0
+        elif required_years == 0 and not preferred_years:
+            experience_result = 0.5
+        elif years >= required_years:
+            if preferred_years and years >= preferred_years:
+                experience_result = 1.0
+            else:
+                experience_result = 0.7 + min(0.3, (years - required_years) * 0.05)
+        else:
+            experience_result = years / required_years * 0.6
         
-        education_score = self.score_education(
-            processed_data.get('education', {}),
-            job_requirements.get('education_level'),
-            job_requirements.get('preferred_education_level')
-        )
+        if not education.get('has_degree', False):
+            education_result = 0.2 if degree_required else 0.6
+        else:
+            current_score = LEVEL_SCORES[_level_id(education)]
+            if not current_score:
+                education_result = 0.5
+            elif not has_education_requirement:
+                education_result = current_score / 4.0
+            elif current_score < required_score:
+                education_result = current_score / max(required_score, 1) * 0.6
+            elif preferred_score and current_score >= preferred_score:
+                education_result = 1.0
+            else:
+                education_result = 0.7 + min(0.3, (current_score - required_score) * 0.15)
         
-        quality_score = self.score_resume_quality(processed_data)
+        if text_length < self.min_text_length or word_count < self.min_word_count:
+            quality_score = 0.1
+        else:
+            quality_score = (
+                0.0
+                + 0.25 * has_email
+                + 0.15 * has_phone
+                + 0.10 * has_linkedin
+                + 0.15 * (total_skills > 0)
+                + 0.10 * (total_skills > 0 and num_skill_cats > 2)
+                + 0.15 * (total_years > 0)
+                + 0.10 * has_orgs
+            )
+        
+        return skills_score, experience_result, education_result, quality_score
+    
+    def calculate_overall_score(self, processed_data, job_requirements=None):
+        """Calculate final weighted score with detailed breakdown as a ScoreResult"""
+        job_requirements = job_requirements or {}
+        return self._score_result(processed_data, job_requirements, self._prepare_job(job_requirements))
+    
+    def specialize(self, job_requirements=None):
+        """Return a calculate_overall_score for one job, with its requirements prepared once"""
+        # For scoring a stream of resumes against the same job one at a time
+        job_requirements = job_requirements or {}
+        job = self._prepare_job(job_requirements)
         
-        # Store component scores
-        component_scores = {
-            'skills_match': skills_score,
-            'experience_years': experience_score,
-            'education': education_score,
-            'resume_quality': quality_score
-        }
+        def score_one(processed_data):
+            return self._score_result(processed_data, job_requirements, job)
+        
+        return score_one
+    
+    def _score_result(self, processed_data, job_requirements, job):
+        """Weighted score with detailed breakdown against prepared job constants"""
+        if not processed_data:
+            return self._empty_score_result()
+        
+        # Nested sections read once, for both the scores and the feedback
+        education = processed_data.get('education', {})
+        years = processed_data.get('experience', {}).get('total_years', 0)
+        
+        # Calculate individual component scores
+        skills_score, experience_score, education_score, quality_score = self._score_all(processed_data, education, years, job)
+        
+        # Store component scores, in COMPONENTS order
+        component_scores = (skills_score, experience_score, education_score, quality_score)
         
         # Calculate weighted overall score
-        overall_score = sum(
-            component_scores[component] * weight
-            for component, weight in self.weights.items()
+        skills_weight, experience_weight, education_weight, quality_weight = self._weight_values
+        overall_score = (
+            skills_score * skills_weight
+            + experience_score * experience_weight
+            + education_score * education_weight
+            + quality_score * quality_weight
         )
         
         # Generate detailed feedback
-        feedback = self._generate_feedback(component_scores, processed_data, job_requirements)
+        feedback = self._generate_feedback(
+            component_scores, years, job_requirements.get('min_experience', 0), education.get('level', 'None')
+        )
         
-        return {
-            'overall_score': overall_score,
-            'component_scores': component_scores,
-            'score_percentage': round(overall_score * 100, 1),
-            'feedback': feedback,
-            'recommendation': self._get_recommendation(overall_score)
-        }
+        return ScoreResult(
+            overall_score,
+            component_scores,
+            round(overall_score * 100, 1),
+            feedback,
+            self._get_recommendation(overall_score)
+        )
     
-    def _generate_feedback(self, component_scores, processed_data, job_requirements):
-        """Generate detailed feedback for each component"""
-        feedback = {}
-        
-        # Skills feedback
-        skills_score = component_scores['skills_match']
-        if skills_score < 0.5:
-            feedback['skills'] = "Consider adding more relevant technical skills mentioned in the job description."
-        elif skills_score < 0.8:
-            feedback['skills'] = "Good skill match, but could be improved by learning additional required skills."
-        else:
-            feedback['skills'] = "Excellent skill match with job requirements."
+    def calculate_overall_scores_batch(self, processed_list, job_requirements=None):
+        """Score many resumes against one job at once, returning a SCORE_DTYPE structured array"""
+        job_requirements = job_requirements or {}
+        results = np.zeros(len(processed_list), dtype=SCORE_DTYPE)
+        results['recommendation'] = 'Unable to Evaluate'
         
-        # Experience feedback
-        exp_score = component_scores['experience_years']
-        years = processed_data.get('experience', {}).get('total_years', 0)
-        required = job_requirements.get('min_experience', 0)
+        # Resumes without processed data keep the empty score result
+        valid = np.fromiter((bool(data) for data in processed_list), dtype=bool, count=len(processed_list))
+        processed_list = [data for data in processed_list if data]
         
-        if exp_score < 0.5:
-            feedback['experience'] = f"Experience ({years} years) is below the required {required} years."
-        elif exp_score < 0.8:
-            feedback['experience'] = f"Experience ({years} years) meets basic requirements."
+        # The parallel kernel scores one resume per thread; without Numba the
+        # NumPy path is much faster than the kernel run as plain Python
+        if HAS_NUMBA:
+            component_scores, overall_scores = self._score_batch_parallel(processed_list, job_requirements)
         else:
-            feedback['experience'] = f"Excellent experience level ({years} years) for this role."
-        
-        # Education feedback
-        edu_score = component_scores['education']
-        edu_level = processed_data.get('education', {}).get('level', 'None')
+            component_scores, overall_scores = self._score_batch_vectorized(processed_list, job_requirements)
+        
+        results['overall_score'][valid] = overall_scores
+        for column, component in enumerate(self._component_order):
+            results[component][valid] = component_scores[:, column]
+        # Python's round is correctly rounded where np.round can be off by one at .x5
+        results['score_percentage'][valid] = [round(score * 100, 1) for score in overall_scores.tolist()]
+        # side='right' puts a score equal to a threshold in the bucket above it
+        results['recommendation'][valid] = _RECOMMENDATION_ARRAY[
+            np.searchsorted(_THRESHOLD_ARRAY, overall_scores, side='right')
+        ]
+        
+        return results
+    
+    def _score_batch_parallel(self, processed_list, job_requirements):
+        """Component and overall scores for a batch from the Numba prange kernel"""
+        count = len(processed_list)
+        
+        # Skills as rows of uint64 bitmask words, all wide enough for the largest skill id
+        required_bits, nice_to_have_bits, extra_skill_ids = _requirement_skillsets(
+            tuple(job_requirements.get('required_skills') or ()),
+            tuple(job_requirements.get('nice_to_have_skills') or ())
+        )
+        resume_bits = [self._resume_skill_bits(self._resume_skills(data), extra_skill_ids) for data in processed_list]
+        # The union of all masks is as long as the longest one
+        width = functools.reduce(operator.or_, resume_bits, required_bits | nice_to_have_bits).bit_length() // 64 + 1
+        
+        # Education rank per resume: -1 without a degree, 0 when the level is unclear
+        education_list = [data.get('education', {}) for data in processed_list]
+        education_ranks = np.where(
+            np.fromiter(
+                (education.get('has_degree', False) for education in education_list),
+                dtype=bool, count=count
+            ),
+            LEVEL_SCORE_LUT[np.fromiter(map(_level_id, education_list), dtype=np.intp, count=count)],
+            -1
+        ).astype(np.int64)
+        
+        required_level = job_requirements.get('education_level')
+        preferred_level = job_requirements.get('preferred_education_level')
+        preferred_years = job_requirements.get('preferred_experience')
+        
+        with _SCORE_BATCH_LOCK:
+            return score_batch(
+                np.fromiter(
+                    (data.get('experience', {}).get('total_years', 0) for data in processed_list),
+                    dtype=np.float64, count=count
+                ),
+                education_ranks,
+                _bits_to_words(resume_bits, width),
+                self._score_quality_batch(processed_list),
+                _bits_to_words([required_bits], width)[0],
+                _bits_to_words([nice_to_have_bits], width)[0],
+                float(job_requirements.get('min_experience', 0)),
+                bool(preferred_years),
+                float(preferred_years or 0),
+                bool(required_level or preferred_level),
+                bool(required_level),
+                LEVEL_SCORES[LEVEL_ID.get(required_level, 0)],
+                LEVEL_SCORES[LEVEL_ID.get(preferred_level, 0)],
+                self._weight_vec
+            )
+    
+    def _score_batch_vectorized(self, processed_list, job_requirements):
+        """Component and overall scores for a batch from per-component NumPy passes"""
+        count = len(processed_list)
+        
+        # One contiguous row per component, in _component_order
+        component_rows = np.stack([
+            self._score_skills_batch(
+                processed_list,
+                job_requirements.get('required_skills', []),
+                job_requirements.get('nice_to_have_skills', [])
+            ),
+            self._score_experience_batch(
+                np.fromiter(
+                    (data.get('experience', {}).get('total_years', 0) for data in processed_list),
+                    dtype=np.float64, count=count
+                ),
+                job_requirements.get('min_experience', 0),
+                job_requirements.get('preferred_experience')
+            ),
+            self._score_education_batch(
+                processed_list,
+                job_requirements.get('education_level'),
+                job_requirements.get('preferred_education_level')
+            ),
+            self._score_quality_batch(processed_list)
+        ])
+        
+        # Accumulated component by component in the same order as calculate_overall_score,
+        # so batch and single-resume scores agree to the last bit (a BLAS matvec does not)
+        overall_scores = np.zeros(count)
+        weighted = np.empty(count)
+        for row, weight in zip(component_rows, self._weight_vec):
+            np.multiply(row, weight, out=weighted)
+            overall_scores += weighted
+        
+        # Transposed view: one column per component, like the parallel kernel's output
+        return component_rows.T, overall_scores
+    
+    def _score_skills_batch(self, processed_list, required_skills, nice_to_have_skills=None):
+        """Vectorized score_skills_match over a list of processed resumes"""
+        if not required_skills and not nice_to_have_skills:
+            return np.full(len(processed_list), 0.5)
         
-        if edu_score < 0.5:
-            feedback['education'] = f"Education level ({edu_level}) may not meet job requirements."
+        required_skill_bits, nice_to_have_skill_bits, extra_skill_ids = _requirement_skillsets(
+            tuple(required_skills or ()), tuple(nice_to_have_skills or ())
+        )
+        resume_skill_bits = [
+            self._resume_skill_bits(self._resume_skills(data), extra_skill_ids) for data in processed_list
+        ]
+        
+        def match_fractions(skill_bits):
+            return np.fromiter(
+                (_match_fraction(skill_bits, bits) for bits in resume_skill_bits),
+                dtype=np.float64, count=len(resume_skill_bits)
+            )
+        
+        if required_skill_bits and nice_to_have_skill_bits:
+            final_scores = match_fractions(required_skill_bits) * 0.8 + match_fractions(nice_to_have_skill_bits) * 0.2
+        elif required_skill_bits:
+            final_scores = match_fractions(required_skill_bits)
+        elif nice_to_have_skill_bits:
+            final_scores = match_fractions(nice_to_have_skill_bits)
         else:
-            feedback['education'] = f"Education level ({edu_level}) is appropriate for this role."
-        
-        # Quality feedback
-        quality_score = component_scores['resume_quality']
-        if quality_score < 0.5:
-            feedback['quality'] = "Resume could be improved with more complete contact information and better formatting."
-        elif quality_score < 0.8:
-            feedback['quality'] = "Resume quality is good but could be enhanced."
+            final_scores = np.full(len(processed_list), 0.5)
+        
+        return final_scores
+    
+    def _score_experience_batch(self, years_experience, required_years=0, preferred_years=None):
+        """Vectorized score_experience over an array of years of experience"""
+        # Same selects as the experience_score kernel, one np.where per regime
+        preferred_met = (years_experience >= preferred_years) if preferred_years else 0.0
+        met_scores = np.maximum(0.7 + np.minimum(0.3, (years_experience - required_years) * 0.05), preferred_met)
+        below_scores = years_experience / (required_years if required_years > 0 else 1) * 0.6
+        scores = np.where(years_experience >= required_years, met_scores, below_scores)
+        
+        if required_years == 0 and not preferred_years:
+            scores = np.full(years_experience.shape, 0.5)
+        return np.where(years_experience < 0, 0.0, scores)
+    
+    def _score_education_batch(self, processed_list, required_level=None, preferred_level=None):
+        """Vectorized score_education over a list of processed resumes"""
+        education_list = [data.get('education', {}) for data in processed_list]
+        has_degree = np.fromiter(
+            (education.get('has_degree', False) for education in education_list),
+            dtype=bool, count=len(education_list)
+        )
+        # 0 marks a degree whose level is unclear
+        current_scores = LEVEL_SCORE_LUT[
+            np.fromiter(map(_level_id, education_list), dtype=np.intp, count=len(education_list))
+        ]
+        
+        if not required_level and not preferred_level:
+            scores = current_scores / 4.0
         else:
-            feedback['quality'] = "Excellent resume quality and completeness."
+            required_score = LEVEL_SCORES[LEVEL_ID.get(required_level, 0)]
+            preferred_score = LEVEL_SCORES[LEVEL_ID.get(preferred_level, 0)]
+            
+            bonus = np.minimum(0.3, (current_scores - required_score) * 0.15)
+            met_scores = np.where(current_scores > required_score, 0.7 + bonus, 0.7)
+            if preferred_score:
+                met_scores = np.where(current_scores >= preferred_score, 1.0, met_scores)
+            
+            below_scores = current_scores / max(required_score, 1) * 0.6
+            scores = np.where(current_scores >= required_score, met_scores, below_scores)
         
-        return feedback
+        scores = np.where(current_scores == 0, 0.5, scores)
+        return np.where(has_degree, scores, 0.2 if required_level else 0.6)
+    
+    def _generate_feedback(self, component_scores, years, required_years, education_level):
+        """Generate detailed feedback for each component as (component, message) pairs"""
+        # Resumes scored against the same job mostly share tiers, years and education
+        # level, so the messages are built once per combination and shared
+        skills_score, experience_score, education_score, quality_score = component_scores
+        key = (
+            _feedback_bucket(skills_score),
+            _feedback_bucket(experience_score),
+            years,
+            required_years,
+            1 - (education_score < 0.5),
+            education_level,
+            _feedback_bucket(quality_score)
+        )
+        try:
+            return _feedback_messages(*key)
+        except TypeError:
+            # Unhashable values are formatted without the cache
+            return _feedback_messages.__wrapped__(*key)
     
     def _get_recommendation(self, overall_score):
         """Get hiring recommendation based on overall score"""
-        if overall_score >= 0.8:
-            return "Strong Candidate - Recommend for Interview"
-        elif overall_score >= 0.6:
-            return "Good Candidate - Consider for Interview"
-        elif overall_score >= 0.4:
-            return "Moderate Candidate - Review Carefully"
-        else:
-            return "Weak Candidate - Consider Rejection"
+        return RECOMMENDATIONS[bisect.bisect_right(RECOMMENDATION_THRESHOLDS, overall_score)]
     
     def _empty_score_result(self):
         """Return empty score result for error cases"""
-        return {
-            'overall_score': 0.0,
-            'component_scores': {
-                'skills_match': 0.0,
-                'experience_years': 0.0,
-                'education': 0.0,
-                'resume_quality': 0.0
-            },
-            'score_percentage': 0.0,
-            'feedback': {'error': 'Could not process resume'},
-            'recommendation': 'Unable to Evaluate'
-        }
\ No newline at end of file
+        return ScoreResult(
+            0.0,
+            (0.0, 0.0, 0.0, 0.0),
+            0.0,
+            (('error', 'Could not process resume'),),
+            'Unable to Evaluate'
+        )
\ No newline at end of file
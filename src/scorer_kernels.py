@@ -0,0 +1,127 @@
+import numpy as np
+
+# Numba is optional: without it the kernels run as plain Python functions.
+# Parallel kernels launched from Streamlit's script threads left the TBB layer
+# hanging at interpreter shutdown, so deployments pick another layer through
+# NUMBA_THREADING_LAYER (see .devcontainer/devcontainer.json); callers serialize
+# parallel launches, which makes the workqueue layer safe
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+@njit(cache=True)
+def max_year_span(start_years, end_years, current_year):
+    """Longest end - start span over date ranges; an end year of 0 means ongoing"""
+    best = 0
+    for i in range(start_years.size):
+        end_year = end_years[i] if end_years[i] > 0 else current_year
+        span = end_year - start_years[i]
+        if i == 0 or span > best:
+            best = span
+    return best
+
+@njit(cache=True)
+def experience_score(years, required_years, has_preferred, preferred_years):
+    """Experience component score from years of experience against required and preferred years"""
+    # Meeting requirements: 0.7 plus diminishing returns for extra experience (max 0.3
+    # bonus, 0 at exactly the required years), or 1.0 once the preferred years are met.
+    # 0.7 + 0.3 rounds to exactly 1.0, so the sum needs no clamp.
+    preferred_met = 1.0 if has_preferred and years >= preferred_years else 0.0
+    met_score = max(0.7 + min(0.3, (years - required_years) * 0.05), preferred_met)
+    # Max 60% if below requirements
+    below_score = years / (required_years if required_years > 0 else 1.0) * 0.6
+    score = met_score if years >= required_years else below_score
+    
+    # No experience requirements: neutral score
+    score = 0.5 if required_years == 0 and not has_preferred else score
+    return 0.0 if years < 0 else score
+
+@njit(cache=True)
+def education_score(current_score, required_score, preferred_score):
+    """Education component score from hierarchy ranks; a preferred rank of 0 means none"""
+    if current_score >= required_score:
+        if preferred_score and current_score >= preferred_score:
+            return 1.0
+        if current_score > required_score:
+            return 0.7 + min(0.3, (current_score - required_score) * 0.15)
+        return 0.7
+    
+    # Penalty for not meeting education requirements
+    return current_score / max(required_score, 1) * 0.6
+
+@njit(cache=True)
+def education_component(rank, has_requirement, degree_required, required_score, preferred_score):
+    """Full education score from a resume's rank: -1 without a degree, 0 when the level is unclear"""
+    if rank < 0:
+        return 0.2 if degree_required else 0.6
+    if rank == 0:
+        return 0.5
+    if not has_requirement:
+        return rank / 4.0
+    return education_score(rank, required_score, preferred_score)
+
+@njit(cache=True)
+def popcount64(word):
+    """Number of set bits in a uint64 word"""
+    count = 0
+    while word:
+        word &= word - np.uint64(1)
+        count += 1
+    return count
+
+@njit(cache=True)
+def skills_component(resume_words, required_words, nice_to_have_words):
+    """Skills score from uint64 skill bitmask words, weighting required 0.8 and nice-to-have 0.2"""
+    required_total = 0
+    required_matches = 0
+    nice_to_have_total = 0
+    nice_to_have_matches = 0
+    for w in range(resume_words.size):
+        required_total += popcount64(required_words[w])
+        required_matches += popcount64(required_words[w] & resume_words[w])
+        nice_to_have_total += popcount64(nice_to_have_words[w])
+        nice_to_have_matches += popcount64(nice_to_have_words[w] & resume_words[w])
+    
+    if required_total and nice_to_have_total:
+        score = (required_matches / required_total) * 0.8 + (nice_to_have_matches / nice_to_have_total) * 0.2
+    elif required_total:
+        score = required_matches / required_total
+    elif nice_to_have_total:
+        score = nice_to_have_matches / nice_to_have_total
+    else:
+        score = 0.5
+    return score
+
+@njit(parallel=True, cache=True)
+def score_batch(years, education_ranks, skills_words, quality_scores,
+                required_words, nice_to_have_words,
+                required_years, has_preferred_years, preferred_years,
+                has_education_requirement, degree_required, required_rank, preferred_rank,
+                weights):
+    """Component scores (N, 4) and weighted overall scores (N,) for a batch of resumes, one per prange iteration"""
+    count = years.size
+    components = np.empty((count, 4))
+    overall = np.empty(count)
+    for i in prange(count):
+        components[i, 0] = skills_component(skills_words[i], required_words, nice_to_have_words)
+        components[i, 1] = experience_score(years[i], required_years, has_preferred_years, preferred_years)
+        components[i, 2] = education_component(
+            education_ranks[i], has_education_requirement, degree_required, required_rank, preferred_rank
+        )
+        components[i, 3] = quality_scores[i]
+        
+        # Same accumulation order as the single-resume weighted sum
+        total = 0.0
+        for j in range(4):
+            total += components[i, j] * weights[j]
+        overall[i] = total
+    return components, overall
@@ -0,0 +1,62 @@
+import sys
+
+# Predefined skill sets (expand these based on your needs)
+TECH_SKILLS = {
+    'programming': [
+        'python', 'java', 'javascript', 'c++', 'c#', 'php', 'ruby', 'go',
+        'swift', 'kotlin', 'scala', 'r', 'matlab', 'sql', 'html', 'css',
+        'typescript', 'perl', 'shell', 'bash', 'powershell'
+    ],
+    'frameworks': [
+        'react', 'angular', 'vue', 'django', 'flask', 'spring', 'nodejs',
+        'express', 'laravel', 'rails', 'tensorflow', 'pytorch', 'keras',
+        'scikit-learn', 'pandas', 'numpy', 'bootstrap', 'jquery'
+    ],
+    'tools': [
+        'git', 'docker', 'kubernetes', 'jenkins', 'ansible', 'terraform',
+        'vagrant', 'maven', 'gradle', 'npm', 'yarn', 'webpack', 'jira',
+        'confluence', 'slack', 'trello'
+    ],
+    'databases': [
+        'mysql', 'postgresql', 'mongodb', 'oracle', 'redis', 'elasticsearch',
+        'sqlite', 'cassandra', 'dynamodb', 'neo4j', 'influxdb'
+    ],
+    'cloud': [
+        'aws', 'azure', 'gcp', 'heroku', 'digital ocean', 'linode',
+        's3', 'ec2', 'lambda', 'cloudformation', 'terraform'
+    ],
+    'soft_skills': [
+        'leadership', 'communication', 'teamwork', 'problem solving',
+        'project management', 'agile', 'scrum', 'kanban', 'analytical',
+        'creative', 'innovative', 'collaborative'
+    ]
+}
+
+def normalize_skill(name):
+    """Canonical form of a skill name: stripped, casefolded and interned"""
+    # Interned so equal skills across resumes and jobs share one string object
+    return sys.intern(name.strip().casefold())
+
+# Integer id per normalized skill name in the taxonomy. Fixed for the life of the
+# process: resume skills are only ever extracted from TECH_SKILLS, so skills that
+# appear only in job requirements never get global ids
+SKILL_VOCAB = {}
+for _skills in TECH_SKILLS.values():
+    for _skill in _skills:
+        SKILL_VOCAB.setdefault(normalize_skill(_skill), len(SKILL_VOCAB))
+
+# Integer id per education level name reported by the extractor; 0 means no level found
+LEVEL_ID = {'Associates': 1, 'Bachelors': 2, 'Masters': 3, 'MBA': 4, 'PhD': 5}
+
+def skill_bits(names, extra_ids=None):
+    """Map normalized skill names to a bitmask with one bit per skill id"""
+    # extra_ids holds caller-local ids for names outside SKILL_VOCAB; other
+    # unknown names have no bit
+    bits = 0
+    for name in names:
+        skill_id = SKILL_VOCAB.get(name)
+        if skill_id is None and extra_ids:
+            skill_id = extra_ids.get(name)
+        if skill_id is not None:
+            bits |= 1 << skill_id
+    return bits
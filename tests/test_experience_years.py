@@ -0,0 +1,43 @@
+import unittest
+
+from src.nlp_processor import MAX_TOTAL_YEARS, NLPProcessor
+from src.scorer import ResumeScorer
+
+# A digit run far past the float64 range in front of "years"
+LONG_YEARS_TEXT = (
+    "Jane Doe jane@example.com (555) 123-4567\n"
+    "Software engineer with " + "9" * 400 + " years of experience in Python, Docker and SQL.\n"
+    "Bachelor of Science in Computer Science"
+)
+
+class LongYearsRunTest(unittest.TestCase):
+    """Absurd stated years are capped instead of failing the resume"""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.processor = NLPProcessor()
+        cls.scorer = ResumeScorer()
+    
+    def test_process_resume_keeps_other_fields(self):
+        """Skills and contact details survive a digit run too long for float64"""
+        result = self.processor.process_resume(LONG_YEARS_TEXT, deep=False)
+        self.assertEqual(result['experience']['total_years'], MAX_TOTAL_YEARS)
+        self.assertEqual(result['contact_info']['email'], 'jane@example.com')
+        self.assertGreater(result['total_skills'], 0)
+    
+    def test_fallback_extraction_is_capped(self):
+        """The regex fallback used without spaCy applies the same cap"""
+        experience = self.processor._extract_experience_fallback(LONG_YEARS_TEXT)
+        self.assertEqual(experience['total_years'], MAX_TOTAL_YEARS)
+    
+    def test_scoring(self):
+        """Single and batch scoring accept the capped years"""
+        result = self.processor.process_resume(LONG_YEARS_TEXT, deep=False)
+        job = {'required_skills': ['Python'], 'min_experience': 3}
+        single = self.scorer.calculate_overall_score(result, job)
+        batch = self.scorer.calculate_overall_scores_batch([result], job)
+        self.assertEqual(single.component_scores[1], 1.0)
+        self.assertEqual(batch[0]['overall_score'], single.overall_score)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,352 @@
+import random
+import unittest
+from unittest import mock
+
+from src import scorer as scorer_module
+from src.scorer import COMPONENTS, ResumeScorer, quality_features
+from src.skills import LEVEL_ID, TECH_SKILLS, normalize_skill, skill_bits
+
+# Original scoring rules, kept verbatim as the reference every fast path must
+# reproduce to the last bit
+class BaselineScorer:
+    """Reference implementation of the original ResumeScorer"""
+    
+    weights = {
+        'skills_match': 0.4,
+        'experience_years': 0.25,
+        'education': 0.20,
+        'resume_quality': 0.15
+    }
+    min_text_length = 100
+    min_word_count = 20
+    
+    def score_skills_match(self, resume_skills, required_skills, nice_to_have_skills=None):
+        """Original set-based skill matching"""
+        if not required_skills and not nice_to_have_skills:
+            return 0.5
+        
+        resume_skill_set = {skill.lower().strip() for skills in resume_skills.values() for skill in skills}
+        required_skill_set = {skill.lower().strip() for skill in (required_skills or [])}
+        nice_to_have_skill_set = {skill.lower().strip() for skill in (nice_to_have_skills or [])}
+        
+        required_score = 0
+        if required_skill_set:
+            required_score = len(resume_skill_set & required_skill_set) / len(required_skill_set)
+        
+        nice_to_have_score = 0
+        if nice_to_have_skill_set:
+            nice_to_have_score = len(resume_skill_set & nice_to_have_skill_set) / len(nice_to_have_skill_set)
+        
+        if required_skill_set and nice_to_have_skill_set:
+            final_score = (required_score * 0.8) + (nice_to_have_score * 0.2)
+        elif required_skill_set:
+            final_score = required_score
+        elif nice_to_have_skill_set:
+            final_score = nice_to_have_score
+        else:
+            final_score = 0.5
+        
+        return min(final_score, 1.0)
+    
+    def score_experience(self, years_experience, required_years=0, preferred_years=None):
+        """Original branchy experience score"""
+        if years_experience < 0:
+            return 0.0
+        
+        if required_years == 0 and not preferred_years:
+            return 0.5
+        
+        if years_experience >= required_years:
+            base_score = 0.7
+            if preferred_years and years_experience >= preferred_years:
+                base_score = 1.0
+            elif years_experience > required_years:
+                bonus = min(0.3, (years_experience - required_years) * 0.05)
+                base_score = min(1.0, base_score + bonus)
+            return base_score
+        
+        if required_years > 0:
+            return years_experience / required_years * 0.6
+        return 0.5
+    
+    def score_education(self, education_info, required_level=None, preferred_level=None):
+        """Original hierarchy-based education score"""
+        if not education_info.get('has_degree', False):
+            return 0.2 if required_level else 0.6
+        
+        education_hierarchy = {'Associates': 1, 'Bachelors': 2, 'Masters': 3, 'MBA': 3, 'PhD': 4}
+        
+        current_level = education_info.get('level')
+        if not current_level:
+            return 0.5
+        
+        current_score = education_hierarchy.get(current_level, 1)
+        
+        if not required_level and not preferred_level:
+            return min(current_score / 4.0, 1.0)
+        
+        required_score = education_hierarchy.get(required_level, 0) if required_level else 0
+        preferred_score = education_hierarchy.get(preferred_level, 0) if preferred_level else 0
+        
+        if current_score >= required_score:
+            base_score = 0.7
+            if preferred_score and current_score >= preferred_score:
+                base_score = 1.0
+            elif current_score > required_score:
+                bonus = min(0.3, (current_score - required_score) * 0.15)
+                base_score = min(1.0, base_score + bonus)
+            return base_score
+        return current_score / max(required_score, 1) * 0.6
+    
+    def score_resume_quality(self, processed_data):
+        """Original additive quality score"""
+        if (processed_data.get('text_length', 0) < self.min_text_length
+                or processed_data.get('word_count', 0) < self.min_word_count):
+            return 0.1
+        
+        quality_score = 0.0
+        contact = processed_data.get('contact_info', {})
+        if contact.get('email'):
+            quality_score += 0.25
+        if contact.get('phone'):
+            quality_score += 0.15
+        if contact.get('linkedin'):
+            quality_score += 0.10
+        
+        skills = processed_data.get('skills', {})
+        if sum(len(skill_list) for skill_list in skills.values()) > 0:
+            quality_score += 0.15
+            if len(skills) > 2:
+                quality_score += 0.10
+        
+        experience = processed_data.get('experience', {})
+        if experience.get('total_years', 0) > 0:
+            quality_score += 0.15
+        if experience.get('organizations'):
+            quality_score += 0.10
+        
+        return min(quality_score, 1.0)
+    
+    def calculate_overall_score(self, processed_data, job_requirements=None):
+        """Original weighted score with feedback and recommendation"""
+        if not processed_data:
+            return {
+                'overall_score': 0.0,
+                'component_scores': dict.fromkeys(COMPONENTS, 0.0),
+                'score_percentage': 0.0,
+                'feedback': {'error': 'Could not process resume'},
+                'recommendation': 'Unable to Evaluate'
+            }
+        
+        job_requirements = job_requirements or {}
+        component_scores = {
+            'skills_match': self.score_skills_match(
+                processed_data.get('skills', {}),
+                job_requirements.get('required_skills', []),
+                job_requirements.get('nice_to_have_skills', [])
+            ),
+            'experience_years': self.score_experience(
+                processed_data.get('experience', {}).get('total_years', 0),
+                job_requirements.get('min_experience', 0),
+                job_requirements.get('preferred_experience')
+            ),
+            'education': self.score_education(
+                processed_data.get('education', {}),
+                job_requirements.get('education_level'),
+                job_requirements.get('preferred_education_level')
+            ),
+            'resume_quality': self.score_resume_quality(processed_data)
+        }
+        overall_score = sum(component_scores[component] * weight for component, weight in self.weights.items())
+        
+        return {
+            'overall_score': overall_score,
+            'component_scores': component_scores,
+            'score_percentage': round(overall_score * 100, 1),
+            'feedback': self._generate_feedback(component_scores, processed_data, job_requirements),
+            'recommendation': self._get_recommendation(overall_score)
+        }
+    
+    def _generate_feedback(self, component_scores, processed_data, job_requirements):
+        """Original per-component feedback messages"""
+        feedback = {}
+        
+        skills_score = component_scores['skills_match']
+        if skills_score < 0.5:
+            feedback['skills'] = "Consider adding more relevant technical skills mentioned in the job description."
+        elif skills_score < 0.8:
+            feedback['skills'] = "Good skill match, but could be improved by learning additional required skills."
+        else:
+            feedback['skills'] = "Excellent skill match with job requirements."
+        
+        exp_score = component_scores['experience_years']
+        years = processed_data.get('experience', {}).get('total_years', 0)
+        required = job_requirements.get('min_experience', 0)
+        if exp_score < 0.5:
+            feedback['experience'] = f"Experience ({years} years) is below the required {required} years."
+        elif exp_score < 0.8:
+            feedback['experience'] = f"Experience ({years} years) meets basic requirements."
+        else:
+            feedback['experience'] = f"Excellent experience level ({years} years) for this role."
+        
+        edu_level = processed_data.get('education', {}).get('level', 'None')
+        if component_scores['education'] < 0.5:
+            feedback['education'] = f"Education level ({edu_level}) may not meet job requirements."
+        else:
+            feedback['education'] = f"Education level ({edu_level}) is appropriate for this role."
+        
+        quality_score = component_scores['resume_quality']
+        if quality_score < 0.5:
+            feedback['quality'] = "Resume could be improved with more complete contact information and better formatting."
+        elif quality_score < 0.8:
+            feedback['quality'] = "Resume quality is good but could be enhanced."
+        else:
+            feedback['quality'] = "Excellent resume quality and completeness."
+        
+        return feedback
+    
+    def _get_recommendation(self, overall_score):
+        """Original threshold ladder"""
+        if overall_score >= 0.8:
+            return "Strong Candidate - Recommend for Interview"
+        elif overall_score >= 0.6:
+            return "Good Candidate - Consider for Interview"
+        elif overall_score >= 0.4:
+            return "Moderate Candidate - Review Carefully"
+        return "Weak Candidate - Consider Rejection"
+
+# Inputs around every threshold of the scoring rules, fractional years included
+YEARS = [-1, 0, 0.5, 1, 2, 2.5, 3, 4, 5, 7.25, 8, 10, 12, 15, 30]
+REQUIRED_YEARS = [0, 1, 2, 3, 5, 8, 10, 2.5]
+LEVELS = [None, 'Associates', 'Bachelors', 'Masters', 'MBA', 'PhD', 'Diploma']
+# Requirement skills outside the taxonomy, in mixed case and padding
+OTHER_SKILLS = ['Cobol', ' Rust ', 'PYTHON', 'Fortran', 'Machine Learning']
+
+def random_resume(rng):
+    """Processed resume dict shaped like NLPProcessor output, with or without prebuilt fields"""
+    skills = {}
+    for category, category_skills in TECH_SKILLS.items():
+        if rng.random() < 0.4:
+            skills[category] = rng.sample(category_skills, rng.randint(1, 4))
+    level = rng.choice(LEVELS)
+    processed_data = {
+        'contact_info': {
+            'email': 'jane@example.com' if rng.random() < 0.7 else None,
+            'phone': '(555) 123-4567' if rng.random() < 0.6 else None,
+            'linkedin': 'https://linkedin.com/in/jane' if rng.random() < 0.4 else None
+        },
+        'skills': skills,
+        'total_skills': sum(len(category_skills) for category_skills in skills.values()),
+        'experience': {
+            'total_years': rng.choice(YEARS),
+            'organizations': ['Acme Corp'] if rng.random() < 0.5 else [],
+            'job_titles': []
+        },
+        'education': {'has_degree': rng.random() < 0.8, 'level': level},
+        'text_length': rng.choice([50, 99, 100, 500, 3000]),
+        'word_count': rng.choice([10, 19, 20, 80, 600])
+    }
+    
+    # NLPProcessor adds the derived fields; hand-built dicts may lack them
+    if rng.random() < 0.5:
+        processed_data['education']['level_id'] = LEVEL_ID.get(level, 1) if level else 0
+        skills_flat_set = frozenset(
+            normalize_skill(skill) for category_skills in skills.values() for skill in category_skills
+        )
+        processed_data['skills_flat_set'] = skills_flat_set
+        processed_data['skills_bits'] = skill_bits(skills_flat_set)
+        processed_data['quality_features'] = quality_features(processed_data)
+    return processed_data
+
+def random_job(rng):
+    """Job requirements dict as the sidebar builds it, with skills in and outside the taxonomy"""
+    vocabulary = [skill for category_skills in TECH_SKILLS.values() for skill in category_skills]
+    min_experience = rng.choice(REQUIRED_YEARS)
+    return {
+        'required_skills': rng.sample(vocabulary + OTHER_SKILLS, rng.randint(0, 6)),
+        'nice_to_have_skills': rng.sample(vocabulary + OTHER_SKILLS, rng.randint(0, 4)),
+        'min_experience': min_experience,
+        'preferred_experience': rng.choice([None, min_experience + 2, min_experience + 5]),
+        'education_level': rng.choice(LEVELS[:-1]),
+        'preferred_education_level': rng.choice(LEVELS[:-1])
+    }
+
+class ScoringParityTest(unittest.TestCase):
+    """Every scoring path agrees with the original rules bit for bit"""
+    
+    JOBS = 60
+    RESUMES_PER_JOB = 40
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.scorer = ResumeScorer()
+        cls.baseline = BaselineScorer()
+        rng = random.Random(20240601)
+        cls.cases = [
+            (random_job(rng), [random_resume(rng) for _ in range(cls.RESUMES_PER_JOB)] + [{}])
+            for _ in range(cls.JOBS)
+        ]
+    
+    def test_component_scorers(self):
+        """The public score_* methods match the original ones"""
+        for job, resumes in self.cases:
+            for processed_data in resumes[:-1]:
+                self.assertEqual(
+                    self.scorer.score_skills_match(
+                        processed_data['skills'], job['required_skills'], job['nice_to_have_skills']
+                    ),
+                    self.baseline.score_skills_match(
+                        processed_data['skills'], job['required_skills'], job['nice_to_have_skills']
+                    )
+                )
+                years = processed_data['experience']['total_years']
+                self.assertEqual(
+                    self.scorer.score_experience(years, job['min_experience'], job['preferred_experience']),
+                    self.baseline.score_experience(years, job['min_experience'], job['preferred_experience'])
+                )
+                self.assertEqual(
+                    self.scorer.score_education(
+                        processed_data['education'], job['education_level'], job['preferred_education_level']
+                    ),
+                    self.baseline.score_education(
+                        processed_data['education'], job['education_level'], job['preferred_education_level']
+                    )
+                )
+                self.assertEqual(
+                    self.scorer.score_resume_quality(processed_data),
+                    self.baseline.score_resume_quality(processed_data)
+                )
+    
+    def test_single_resume(self):
+        """calculate_overall_score and specialize give the original result dicts"""
+        for job, resumes in self.cases:
+            score_one = self.scorer.specialize(job)
+            for processed_data in resumes:
+                expected = self.baseline.calculate_overall_score(processed_data, job)
+                self.assertEqual(self.scorer.calculate_overall_score(processed_data, job).to_dict(), expected)
+                self.assertEqual(score_one(processed_data).to_dict(), expected)
+    
+    def assert_batch_matches(self):
+        """Compare every batch row with the original single-resume result"""
+        for job, resumes in self.cases:
+            results = self.scorer.calculate_overall_scores_batch(resumes, job)
+            for processed_data, row in zip(resumes, results):
+                expected = self.baseline.calculate_overall_score(processed_data, job)
+                self.assertEqual(row['overall_score'], expected['overall_score'])
+                self.assertEqual(row['score_percentage'], expected['score_percentage'])
+                self.assertEqual(row['recommendation'], expected['recommendation'])
+                for component in COMPONENTS:
+                    self.assertEqual(row[component], expected['component_scores'][component])
+    
+    @unittest.skipUnless(scorer_module.HAS_NUMBA, "Numba is not installed")
+    def test_batch_parallel(self):
+        """The Numba batch kernel matches the original scores"""
+        self.assert_batch_matches()
+    
+    def test_batch_vectorized(self):
+        """The NumPy batch path used without Numba matches the original scores"""
+        with mock.patch.object(scorer_module, 'HAS_NUMBA', False):
+            self.assert_batch_matches()
+
+if __name__ == '__main__':
+    unittest.main()